@@ -0,0 +1,93 @@
+import threading
+from collections import Counter
+from typing import Union
+
+from . import _Base
+from . import _Table
+from . import _Where
+
+
+class IndexAdvisor:
+    """
+    IndexAdvisor records fields used in selection conditions and JOINs of executed queries,
+    and recommends indexes for the most used of them.
+    """
+    def __init__(self, db: '_Base.DBase', auto_create_after: int = None):
+        self._db = db
+        self._auto_create_after = auto_create_after
+        self._uses: Counter['_Table.TableField'] = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, source: '_Table.Table', where: Union['_Where.Where', None]) -> None:
+        """
+        Record fields used by query.
+
+        If auto_create_after is set, index is created as soon as not indexed field is used that many times.
+
+        :param source: Table query is made to.
+        :param where: selection condition of query.
+        """
+        fields = list(source.join_fields)
+        if where is not None:
+            fields.extend(where.fields())
+
+        reached = []
+        with self._lock:
+            for field in fields:
+                self._uses[field] += 1
+                if self._uses[field] == self._auto_create_after:
+                    reached.append(field)
+
+        for field in reached:
+            if not self.is_indexed(field):
+                field.table.CREATE_INDEX(field.name)
+
+    @staticmethod
+    def is_indexed(field: '_Table.TableField') -> bool:
+        """Can field be searched by index: it is PRIMARY KEY or first field of any index."""
+        if field.is_primary:
+            return True
+        return any(index.covers(field) for index in field.table.indexes.values())
+
+    def recommend(self, min_uses: int = 1, top: int = None) -> list[tuple['_Table.TableField', int]]:
+        """
+        Get the most used fields which are not indexed.
+
+        :param min_uses: minimal amount of uses of field.
+        :param top: maximal amount of recommended fields. None means all.
+        :return: list of (TableField, amount of uses), the most used go first.
+        """
+        with self._lock:
+            used = self._uses.most_common()
+
+        recommended = []
+        for field, uses in used:
+            if uses < min_uses:
+                break
+            if not self.is_indexed(field):
+                recommended.append((field, uses))
+            if (top is not None) and (len(recommended) >= top):
+                break
+        return recommended
+
+    def apply(self, min_uses: int = 1, top: int = None) -> list['_Table.TableIndex']:
+        """
+        Create indexes for recommended fields. See IndexAdvisor.recommend.
+
+        :return: list of created TableIndex objects.
+        """
+        return [field.table.CREATE_INDEX(field.name) for field, _ in self.recommend(min_uses=min_uses, top=top)]
+
+    @property
+    def uses(self) -> dict['_Table.TableField', int]:
+        """Amount of uses of every recorded field."""
+        with self._lock:
+            return dict(self._uses)
+
+    def clear(self) -> None:
+        """Forget all recorded uses."""
+        with self._lock:
+            self._uses.clear()
+
+    def __repr__(self) -> str:
+        return f'IndexAdvisor<{self._db.name}, {len(self._uses)} fields recorded>'
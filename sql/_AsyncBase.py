@@ -0,0 +1,131 @@
+import asyncio
+import functools
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, AsyncIterator, Callable, Mapping, Sequence, Any, Union
+
+from . import _Base
+from . import _Query
+from . import _Report
+from . import _Table
+
+
+class AsyncDBase:
+    """
+    asyncio front-end for SQLite3 database.
+
+    All database work of awaitable methods is done in one dedicated thread with its own connection,
+    so event loop is not blocked while query is running.
+    Schema operations (getting and creating Tables) stay synchronous.
+    """
+    def __init__(self, dbfile: str, sql_cache_size: int = 256, profile: str | Mapping[str, Any] = None):
+        self._db = _Base.DBase(dbfile, sql_cache_size=sql_cache_size, threaded=True, profile=profile)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='AsyncDBase')
+
+    async def run(self, function: Callable, *args, **kwargs) -> Any:
+        """
+        Run function in database thread.
+
+        :param function: any callable using this AsyncDBase's Tables or queries.
+        :return: function result.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(function, *args, **kwargs))
+
+    async def query(self, query: str, commit=False, params: Sequence | Mapping = tuple()) -> list[tuple]:
+        """
+        Make string SQL query to database.
+
+        :param query: SQL query string, may contain '?' placeholders.
+        :param commit: Either commit changes to database with this query or not.
+        :param params: values to bind to query placeholders.
+        :return: all query result rows.
+        """
+        return await self.run(lambda: self._db.query(query, commit=commit, params=params).fetchall())
+
+    async def select(self, source: str, fields: Iterable[str]) -> list[tuple]:
+        """
+        Select fields from table with no confines.
+
+        :param source: source string name as it is in database.
+        :param fields: iterable collection of field string names.
+        :return: list of tuples with selected values
+        """
+        return await self.run(self._db.select, source, tuple(fields))
+
+    async def insert(self, target_table: str, target_fields: Iterable[str], values: Iterable) -> None:
+        """
+        Insert values into target table.
+
+        :param target_table: target table string name as it is in database.
+        :param target_fields: iterable collection of target fields
+        :param values: iterable collection of target values
+        """
+        await self.run(self._db.insert, target_table, tuple(target_fields), tuple(values))
+
+    async def insert_many(self, target_table: str, target_fields: Iterable[str], rows: Iterable[Mapping | Sequence],
+                          chunk_size: int = 1000) -> '_Report.BulkReport':
+        """
+        Insert many rows into target table within single transaction. See DBase.insert_many.
+
+        :return: BulkReport with amount of inserted rows and throughput.
+        """
+        return await self.run(self._db.insert_many, target_table, target_fields, rows, chunk_size=chunk_size)
+
+    async def call(self, query: Union['_Query.SelectQuery', '_Query.UpdateQuery', '_Query.DeleteQuery'],
+                   *args, **kwargs) -> Any:
+        """
+        Awaitable call of SelectQuery, UpdateQuery or DeleteQuery.
+
+        :param query: query object made from this AsyncDBase's Tables.
+        :param args: arguments of query call, f.ex. commit for UpdateQuery.
+        :return: query call result.
+        """
+        return await self.run(query, *args, **kwargs)
+
+    async def stream(self, selection: '_Query.SelectQuery', batch_size: int = 1000) -> AsyncIterator[tuple]:
+        """
+        Lazily iterate over SelectQuery result rows. See SelectQuery.stream.
+
+        :param selection: SelectQuery made from this AsyncDBase's Tables.
+        :param batch_size: amount of rows fetched from database at once.
+        :return: async iterator of select SQL query result rows.
+        """
+        rows = selection.stream(batch_size=batch_size)
+        try:
+            while batch := await self.run(lambda: list(itertools.islice(rows, batch_size))):
+                for row in batch:
+                    yield row
+        finally:
+            await self.run(rows.close)
+
+    def table(self, table_name: str) -> '_Table.Table':
+        """Get Table from base. See DBase.table."""
+        return self._db.table(table_name)
+
+    def new_table(self, table_name: str, fields: dict) -> '_Table.Table':
+        """Create new table in database and get reference Table object for it. See DBase.new_table."""
+        return self._db.new_table(table_name, fields)
+
+    @property
+    def db(self) -> '_Base.DBase':
+        """Synchronous DBase used by this AsyncDBase."""
+        return self._db
+
+    @property
+    def name(self) -> str:
+        """Name of current DBase's file."""
+        return self._db.name
+
+    @property
+    def tables(self) -> set[str]:
+        """All tables present in current DBase's file."""
+        return self._db.tables
+
+    def close(self) -> None:
+        """Stop database thread and close all connections to database."""
+        self._executor.shutdown(wait=True)
+        self._db.close()
+
+    def __repr__(self) -> str:
+        return f'AsyncDBase<{self.name}>'
@@ -1,25 +1,286 @@
+import contextlib
+import itertools
 import sqlite3
-from typing import Iterable, Union
+import threading
+import time
+import weakref
+from typing import Iterable, Iterator, Union, Mapping, Sequence, Hashable, Callable, Any
 
 from . import _exceptions
+from . import _Report
+from . import _Cache
+from . import _Schema
+from . import _Advisor
+from . import _Profiling
+from . import _Pragma
+from . import parsing
 from . import _Table
 from . import _internal
 from . import _FieldConstraints as _Constr
 
 
+class _ThreadOwner:
+    """Per-thread object, which is collected when thread finishes, so its connection is closed."""
+
+
 class DBase:
     """
     SQLite3 database class.
+
+    With threaded=True every thread works with its own connection to database file,
+    and database is switched to WAL journal mode, so readers do not block on writer.
+    Connection of thread is closed when thread finishes.
+
+    Profile sets PRAGMAs of every connection for typical workload: 'bulk_load', 'read_heavy' or 'durable',
+    see DBase.set_profile.
     """
-    def __init__(self, dbfile: str):
+    def __init__(self, dbfile: str, sql_cache_size: int = 256, threaded: bool = False, composite_cache_size: int = 128,
+                 profile: str | Mapping[str, Any] = None):
         self._db_file = dbfile
+        self._profile = profile
+        self._pragmas = _Pragma.profile_pragmas(profile) if profile is not None else dict()
+        self._pragmas_version = 0
+        self._sql_cache = _Cache.LRUCache(sql_cache_size)
+        self._composites: weakref.WeakValueDictionary[Hashable, '_Table.Table'] = weakref.WeakValueDictionary()
+        self._recent_composites = _Cache.LRUCache(composite_cache_size)
+        self._result_cache: _Cache.ResultCache | None = None
+        self._index_advisor: _Advisor.IndexAdvisor | None = None
+        self._slow_query_log: _Profiling.SlowQueryLog | None = None
+        self._before_hooks: list[Callable[['_Profiling.QueryEvent'], None]] = []
+        self._after_hooks: list[Callable[['_Profiling.QueryEvent'], None]] = []
 
-        self._db_connection = sqlite3.connect(self._db_file)
-        self._db_cursor = self._db_connection.cursor()
+        self._threaded = threaded
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
 
+        if self._threaded:
+            self._pragmas['journal_mode'] = 'WAL'
+
+        self._schema = _Schema.SchemaCatalog(self)
         self._db_tables = self.get_tables()
         self._active_tables: dict[str, '_Table.Table'] = dict()
 
+    @property
+    def _db_connection(self) -> sqlite3.Connection:
+        """Connection to database for current thread. Opened on first access."""
+        try:
+            connection = self._local.connection
+        except AttributeError:
+            pass
+        else:
+            if (self._local.pragmas_version != self._pragmas_version) and not connection.in_transaction:
+                self._local.pragmas_version = self._pragmas_version
+                self._apply_pragmas(connection, self._pragmas)
+            return connection
+
+        if not self._threaded and self._connections:
+            connection = self._connections[0]
+        else:
+            connection = sqlite3.connect(self._db_file, check_same_thread=not self._threaded)
+            self._apply_pragmas(connection, self._pragmas)
+            with self._connections_lock:
+                self._connections.append(connection)
+            if self._threaded:
+                self._local.owner = _ThreadOwner()
+                weakref.finalize(self._local.owner, DBase._release, weakref.ref(self), connection)
+        self._local.connection = connection
+        self._local.cursor = connection.cursor()
+        self._local.pragmas_version = self._pragmas_version
+        return connection
+
+    @staticmethod
+    def _release(db_ref: 'weakref.ref[DBase]', connection: sqlite3.Connection) -> None:
+        """Close connection of finished thread and forget it."""
+        if (db := db_ref()) is not None:
+            with db._connections_lock:
+                if connection in db._connections:
+                    db._connections.remove(connection)
+        connection.close()
+
+    @staticmethod
+    def _apply_pragmas(connection: sqlite3.Connection, pragmas: Mapping[str, Any]) -> None:
+        """Set PRAGMAs of connection in given order."""
+        for name, value in pragmas.items():
+            connection.execute(f'PRAGMA {name}={value}').fetchall()
+
+    @staticmethod
+    def _read_pragmas(connection: sqlite3.Connection) -> dict[str, Any]:
+        """Get current values of PRAGMAs, which profiles set."""
+        return {name: connection.execute(f'PRAGMA {name}').fetchone()[0] for name in _Pragma.PRAGMAS}
+
+    def set_profile(self, profile: str | Mapping[str, Any]) -> None:
+        """
+        Switch PRAGMAs of all connections to database to profile.
+
+        Profiles are 'bulk_load', 'read_heavy', 'durable' and 'default' (SQLite defaults),
+        or mapping of {PRAGMA name: value} for journal_mode, synchronous, cache_size, mmap_size, temp_store and page_size.
+        page_size takes effect only for new database file. Threaded DBase always keeps WAL journal mode.
+        Connection of current thread is switched at once, its uncommitted changes are committed before switching.
+        Connections of other threads are switched on their next use out of transaction.
+        Profile can not be switched inside DBase.transaction.
+
+        :param profile: profile name or mapping of PRAGMAs.
+        """
+        if self._tx.depth:
+            raise RuntimeError('profile can not be switched inside transaction')
+        pragmas = _Pragma.profile_pragmas(profile)
+        if self._threaded:
+            pragmas['journal_mode'] = 'WAL'
+
+        connection = self._db_connection
+        if connection.in_transaction:
+            connection.commit()
+            self._finish_transaction()
+        self._apply_pragmas(connection, pragmas)
+        with self._connections_lock:
+            self._profile = profile
+            self._pragmas = _Pragma.profile_pragmas({**self._pragmas, **pragmas})
+            self._pragmas_version += 1
+            self._local.pragmas_version = self._pragmas_version
+
+    @contextlib.contextmanager
+    def use_profile(self, profile: str | Mapping[str, Any]) -> Iterator['DBase']:
+        """
+        Switch to profile inside 'with' block, f.ex. to 'bulk_load' around big import, and switch back after it.
+
+        PRAGMA values in effect before the block are read from database and restored, whatever profile set them.
+
+        :param profile: profile name or mapping of PRAGMAs, see DBase.set_profile.
+        """
+        previous_profile = self._profile
+        previous = self._read_pragmas(self._db_connection)
+        self.set_profile(profile)
+        try:
+            yield self
+        finally:
+            self.set_profile(previous)
+            self._profile = previous_profile
+
+    @property
+    def profile(self) -> str | Mapping[str, Any] | None:
+        """Current PRAGMA profile. None means that PRAGMAs were not changed."""
+        return self._profile
+
+    @property
+    def _db_cursor(self) -> sqlite3.Cursor:
+        """Cursor of connection to database for current thread. Profile switched by other thread is applied here."""
+        self._db_connection
+        return self._local.cursor
+
+    @property
+    def _tx(self) -> threading.local:
+        """Transaction state of current thread's connection."""
+        if not hasattr(self._local, 'depth'):
+            self._local.depth = 0
+            self._local.batch_ops = None
+            self._local.batch_seconds = None
+            self._local.pending = 0
+            self._local.last_commit = time.monotonic()
+            self._local.changed_tables = set()
+        return self._local
+
+    def _finish_transaction(self) -> None:
+        """
+        Drop cached results of tables changed by just committed or rolled back transaction of current thread.
+
+        Other threads may cache results read before commit, so they are dropped once again when changes become visible.
+        """
+        tx = self._tx
+        tx.pending = 0
+        tx.last_commit = time.monotonic()
+        if tx.changed_tables:
+            if self._result_cache is not None:
+                self._result_cache.invalidate(tx.changed_tables)
+            tx.changed_tables = set()
+
+    def commit(self) -> None:
+        """
+        Commit changes to database.
+
+        Inside DBase.transaction nothing is committed until transaction ends.
+        Inside DBase.autocommit_every commits are coalesced until operations or time threshold is reached.
+        """
+        tx = self._tx
+        if tx.depth:
+            return
+        if (tx.batch_ops is not None) or (tx.batch_seconds is not None):
+            tx.pending += 1
+            ops_reached = (tx.batch_ops is not None) and (tx.pending >= tx.batch_ops)
+            time_reached = (tx.batch_seconds is not None) and (time.monotonic() - tx.last_commit >= tx.batch_seconds)
+            if not (ops_reached or time_reached):
+                return
+        self._db_connection.commit()
+        self._finish_transaction()
+
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator['DBase']:
+        """
+        Make all queries inside 'with' block a single transaction.
+
+        Transaction is committed when block ends and rolled back if exception is raised inside block.
+        Nested transactions are made with savepoints, so inner block may be rolled back alone.
+        Uncommitted changes made before outermost transaction are committed when it starts.
+        """
+        tx = self._tx
+        connection = self._db_connection
+        savepoint = f'dbase_savepoint_{tx.depth}'
+        outermost = tx.depth == 0
+
+        if outermost:
+            if connection.in_transaction:
+                connection.commit()
+                self._finish_transaction()
+            connection.execute('BEGIN')
+        else:
+            connection.execute(f'SAVEPOINT {savepoint}')
+
+        tx.depth += 1
+        try:
+            yield self
+        except BaseException:
+            tx.depth -= 1
+            if outermost:
+                connection.rollback()
+                self._finish_transaction()
+            else:
+                connection.execute(f'ROLLBACK TO {savepoint}')
+                connection.execute(f'RELEASE {savepoint}')
+            raise
+        tx.depth -= 1
+        if outermost:
+            connection.commit()
+            self._finish_transaction()
+        else:
+            connection.execute(f'RELEASE {savepoint}')
+
+    @contextlib.contextmanager
+    def autocommit_every(self, n_ops: int = None, seconds: float = None) -> Iterator['DBase']:
+        """
+        Coalesce commits of queries inside 'with' block.
+
+        Changes are committed every n_ops committing operations (Table.INSERT, UpdateQuery, DeleteQuery etc)
+        or on first committing operation after given amount of seconds since last commit.
+        All pending changes are committed when block ends, even if exception is raised inside block.
+
+        :param n_ops: amount of committing operations to coalesce into one commit.
+        :param seconds: maximum time between commits, checked on each committing operation.
+        """
+        if (n_ops is None) and (seconds is None):
+            raise ValueError('n_ops or seconds has to be specified')
+
+        tx = self._tx
+        previous = tx.batch_ops, tx.batch_seconds
+        tx.batch_ops, tx.batch_seconds = n_ops, seconds
+        tx.last_commit = time.monotonic()
+        try:
+            yield self
+        finally:
+            tx.batch_ops, tx.batch_seconds = previous
+            if not tx.depth:
+                self._db_connection.commit()
+                self._finish_transaction()
+
     def table(self, table_name: str) -> '_Table.Table':
         """
         Get Table from base.
@@ -41,6 +302,24 @@ class DBase:
         else:
             raise _exceptions.TableNotFound(table_name, self.name)
 
+    def composite(self, key: Hashable, factory: Callable[[], '_Table.Table']) -> '_Table.Table':
+        """
+        Get composite Table by key, or make it with factory if there is no such composite yet.
+
+        Composites are remembered while they are referenced anywhere, and the most recently used
+        are kept alive by DBase itself, so the same composition is not built twice.
+
+        :param key: composition key: operation and operand Tables.
+        :param factory: function to make new composite Table.
+        :return: existing or new composite Table.
+        """
+        table = self._composites.get(key)
+        if table is None:
+            table = factory()
+            self._composites[key] = table
+        self._recent_composites.put(key, table)
+        return table
+
     def new_table(self, table_name: str, fields: dict) -> '_Table.Table':
         """
         Create new table in database and get reference Table object for it.
@@ -56,26 +335,245 @@ class DBase:
         else:
             fields = f'{", ".join(f"{k} {v}" for k, v in fields.items())}'
             query = f'CREATE TABLE {table_name}({fields});'
-            self.query(query)
-            self._db_connection.commit()
+            self.query(query, commit=True)
 
+            self._schema.invalidate(table_name)
             self._db_tables = self.get_tables()
 
             return self.table(table_name)
 
-    def query(self, query: str, commit=False):
+    def query(self, query: str, commit=False, params: Sequence | Mapping = tuple(), kind: str = None):
         """
         Make string SQL query to database.
 
-        :param query: SQL query string.
+        :param query: SQL query string, may contain '?' placeholders.
         :param commit: Either commit changes to database with this query or not.
+        :param params: values to bind to query placeholders.
+        :param kind: calling query type passed to query hooks. By default, it is detected by SQL command.
         :return: query result whatever is is.
         """
-        res = self._db_cursor.execute(query)
+        res = self._execute(self._db_cursor, query, params, kind=kind)
         if commit:
-            self._db_connection.commit()
+            self.commit()
         return res
 
+    def _execute(self, cursor: sqlite3.Cursor, query: str, params: Sequence | Mapping = tuple(),
+                 fetch: bool = False, kind: str = None) -> sqlite3.Cursor | list[tuple]:
+        """
+        Execute query with cursor, measuring its time.
+
+        :param fetch: True means to fetch and return all result rows instead of cursor.
+        :param kind: calling query type passed to query hooks.
+        """
+        kind = self._before(query, params, kind)
+        started = time.perf_counter()
+        cursor.execute(query, params)
+        result = cursor.fetchall() if fetch else cursor
+        rows = len(result) if fetch else (cursor.rowcount if cursor.rowcount >= 0 else None)
+        self._observe(query, params, time.perf_counter() - started, rows, kind)
+        return result
+
+    def _before(self, query: str, params: Sequence | Mapping, kind: str | None) -> str | None:
+        """Call query hooks registered to be called before query. Return kind of query if it is needed."""
+        if (kind is None) and (self._before_hooks or self._after_hooks):
+            kind = _internal.query_kind(query)
+        if self._before_hooks:
+            event = _Profiling.QueryEvent(query, params, kind)
+            for hook in self._before_hooks:
+                hook(event)
+        return kind
+
+    def _observe(self, query: str, params: Sequence | Mapping, seconds: float, rows: int | None,
+                 kind: str | None = None) -> None:
+        """Register executed query in slow query log and call query hooks registered to be called after query."""
+        if self._after_hooks:
+            event = _Profiling.QueryEvent(query, params, kind or _internal.query_kind(query), seconds, rows)
+            for hook in self._after_hooks:
+                hook(event)
+
+        if ((log := self._slow_query_log) is not None) and (seconds >= log.threshold):
+            plan = None
+            if log.explain:
+                try:
+                    plan = self.explain(query, params)
+                except sqlite3.Error:
+                    pass
+            log.record(_Profiling.SlowQuery(query, params, seconds, rows, plan))
+
+    def explain(self, query: str, params: Sequence | Mapping = tuple()) -> '_Profiling.QueryPlan':
+        """
+        Get query plan of string SQL query.
+
+        :param query: SQL query string, may contain '?' placeholders.
+        :param params: values to bind to query placeholders.
+        :return: parsed result of EXPLAIN QUERY PLAN.
+        """
+        return _Profiling.QueryPlan(self._db_connection.execute(f'EXPLAIN QUERY PLAN {query}', params).fetchall())
+
+    def enable_slow_query_log(self, threshold: float = 0.1, maxlen: int = 1000,
+                              explain: bool = True) -> '_Profiling.SlowQueryLog':
+        """
+        Record queries which take longer than threshold.
+
+        :param threshold: minimal query time in seconds to record it.
+        :param maxlen: amount of the last slow queries to keep.
+        :param explain: True means to record query plan of every slow query.
+        :return: new SlowQueryLog.
+        """
+        self._slow_query_log = _Profiling.SlowQueryLog(threshold, maxlen=maxlen, explain=explain)
+        return self._slow_query_log
+
+    def disable_slow_query_log(self) -> None:
+        """Stop recording slow queries."""
+        self._slow_query_log = None
+
+    def add_query_hook(self, after: Callable[['_Profiling.QueryEvent'], None] = None,
+                       before: Callable[['_Profiling.QueryEvent'], None] = None) -> None:
+        """
+        Register functions to be called for every query made through DBase.
+
+        Hooks get QueryEvent with SQL, parameters and calling query type.
+        Hooks called after query get its duration and amount of rows as well.
+
+        :param after: function called after query is made.
+        :param before: function called before query is made.
+        """
+        if after is not None:
+            self._after_hooks.append(after)
+        if before is not None:
+            self._before_hooks.append(before)
+
+    def remove_query_hook(self, hook: Callable[['_Profiling.QueryEvent'], None]) -> None:
+        """
+        Unregister query hook, added with DBase.add_query_hook.
+
+        :param hook: function to unregister.
+        """
+        for hooks in (self._after_hooks, self._before_hooks):
+            while hook in hooks:
+                hooks.remove(hook)
+
+    def enable_query_stats(self, window: int = 1000) -> '_Profiling.QueryStats':
+        """
+        Aggregate latency percentiles of queries by query shape.
+
+        :param window: amount of the last calls of every query shape to calculate percentiles.
+        :return: new QueryStats, registered as query hook.
+        """
+        stats = _Profiling.QueryStats(window=window)
+        self.add_query_hook(after=stats)
+        return stats
+
+    def fetch(self, query: str, params: Sequence = tuple(), tables: Iterable[str] = tuple(),
+              kind: str = None) -> list[tuple]:
+        """
+        Make string SQL query to database and get all its result rows, using result cache if it is enabled.
+
+        Result is cached only while current connection has no uncommitted changes.
+
+        :param query: SQL query string, may contain '?' placeholders.
+        :param params: values to bind to query placeholders.
+        :param tables: names of tables query selects from, used to invalidate cached result.
+        :param kind: calling query type passed to query hooks. By default, it is detected by SQL command.
+        :return: all query result rows.
+        """
+        cache = self._result_cache
+        if (cache is None) or self._db_connection.in_transaction:
+            return self._execute(self._db_cursor, query, params, fetch=True, kind=kind)
+
+        key = (query, tuple(params))
+        try:
+            rows = cache.get(key)
+        except TypeError:
+            return self._execute(self._db_cursor, query, params, fetch=True, kind=kind)
+
+        if rows is None:
+            generation = cache.generation
+            rows = self._execute(self._db_cursor, query, params, fetch=True, kind=kind)
+            cache.put(key, rows, tables, generation)
+        return list(rows)
+
+    def enable_result_cache(self, maxsize: int = 256, ttl: float = None, max_bytes: int = None) -> '_Cache.ResultCache':
+        """
+        Cache results of SelectQuery calls.
+
+        Cached results are dropped when tables they are selected from are changed through this DBase:
+        with Table.INSERT, UpdateQuery, DeleteQuery, drop etc. Changes made with raw DBase.query are not tracked.
+
+        :param maxsize: maximum amount of cached results.
+        :param ttl: seconds after which cached result expires. None means never.
+        :param max_bytes: approximate memory budget for all cached results. None means no budget.
+        :return: new ResultCache.
+        """
+        self._result_cache = _Cache.ResultCache(maxsize=maxsize, ttl=ttl, max_bytes=max_bytes)
+        return self._result_cache
+
+    def disable_result_cache(self) -> None:
+        """Stop caching results of SelectQuery calls and drop cached results."""
+        self._result_cache = None
+
+    def enable_index_advisor(self, auto_create_after: int = None) -> '_Advisor.IndexAdvisor':
+        """
+        Record fields used in selection conditions and JOINs of queries to recommend indexes.
+
+        :param auto_create_after: create index on field automatically when it is used that many times.
+                                  None means to only recommend indexes, see IndexAdvisor.recommend.
+        :return: new IndexAdvisor.
+        """
+        self._index_advisor = _Advisor.IndexAdvisor(self, auto_create_after=auto_create_after)
+        return self._index_advisor
+
+    def disable_index_advisor(self) -> None:
+        """Stop recording fields used by queries."""
+        self._index_advisor = None
+
+    def invalidate_results(self, tables: Iterable[str]) -> None:
+        """
+        Drop cached results selected from given tables.
+
+        Changes, which are not committed yet, are invisible for other threads, so they may cache old results till commit.
+        Such results are dropped once again when current thread's transaction is committed or rolled back.
+
+        :param tables: names of changed tables.
+        """
+        if self._result_cache is None:
+            return
+        tables = set(tables)
+        self._result_cache.invalidate(tables)
+        if self._db_connection.in_transaction:
+            self._tx.changed_tables.update(tables)
+
+    def stream(self, query: str, params: Sequence | Mapping = tuple(), batch_size: int = 1000,
+               kind: str = None) -> Iterator[tuple]:
+        """
+        Make string SQL query to database and lazily iterate over its result rows.
+
+        Query is executed with separate cursor, so other queries may be made while iterating.
+        Rows are fetched from database in batches of batch_size rows.
+
+        :param query: SQL query string, may contain '?' placeholders.
+        :param params: values to bind to query placeholders.
+        :param batch_size: amount of rows fetched from database at once.
+        :param kind: calling query type passed to query hooks. By default, it is detected by SQL command.
+        :return: iterator of result rows.
+        """
+        kind = self._before(query, params, kind)
+        cursor = self._db_connection.cursor()
+        seconds = 0.0
+        rows = 0
+        try:
+            started = time.perf_counter()
+            cursor.execute(query, params)
+            while batch := cursor.fetchmany(batch_size):
+                seconds += time.perf_counter() - started
+                rows += len(batch)
+                yield from batch
+                started = time.perf_counter()
+            seconds += time.perf_counter() - started
+        finally:
+            cursor.close()
+            self._observe(query, params, seconds, rows, kind)
+
     def select(self, source: str, fields: Iterable[str]) -> list[tuple]:
         """
         Select fields from table with no confines.
@@ -97,14 +595,213 @@ class DBase:
         """
         f_names = []
         f_values = []
-        for f, v in zip(target_fields, _internal.proper_values(values)):
-            if v == "NULL":
+        for f, v in zip(target_fields, values):
+            if v is None:
                 continue
             f_names.append(f)
             f_values.append(v)
 
-        self.query(f'INSERT INTO {target_table}({",".join(f_names)}) VALUES({",".join(f_values)});', commit=True)
-        self._db_connection.commit()
+        self.query(f'INSERT INTO {target_table}({",".join(f_names)}) VALUES({",".join("?" * len(f_names))});',
+                   commit=True, params=f_values, kind='insert')
+        self.invalidate_results((target_table,))
+
+    def insert_many(self, target_table: str, target_fields: Iterable[str], rows: Iterable[Mapping | Sequence],
+                    chunk_size: int = 1000, drop_nulls: bool = True) -> '_Report.BulkReport':
+        """
+        Insert many rows into target table within single transaction.
+
+        Rows are streamed to database with executemany in chunks of chunk_size rows with bound parameters.
+        If any row fails, whole operation is rolled back.
+        Inside DBase.transaction rows are inserted within savepoint of current transaction.
+
+        :param target_table: target table string name as it is in database.
+        :param target_fields: iterable collection of target fields for <tuple> rows.
+        :param rows: iterable collection of <tuple> or <dict> rows.
+        :param chunk_size: amount of rows passed to database at once.
+        :param drop_nulls: True means that None values are not inserted, so database defaults are applied to them.
+        False means to insert them as NULL.
+        :return: BulkReport with amount of inserted rows and throughput.
+        """
+        target_fields = tuple(target_fields) if target_fields is not None else tuple()
+        started = time.perf_counter()
+        count = 0
+        with self.transaction():
+            for fields, chunk in _internal.shaped_chunks(rows, target_fields, chunk_size, drop_nulls=drop_nulls):
+                if fields:
+                    query = f'INSERT INTO {target_table}({",".join(fields)}) VALUES({",".join("?" * len(fields))});'
+                else:
+                    query = f'INSERT INTO {target_table} DEFAULT VALUES;'
+                self._execute_many(query, chunk, 'insert')
+                count += len(chunk)
+        self.invalidate_results((target_table,))
+
+        return _Report.BulkReport(count, time.perf_counter() - started)
+
+    def update_many(self, target_table: str, key_fields: Iterable[str], target_fields: Iterable[str],
+                    rows: Iterable[Mapping | Sequence], chunk_size: int = 1000) -> '_Report.BulkReport':
+        """
+        Update many rows of target table with different values within single transaction.
+
+        Every row is found by values of key fields, and the rest of its fields are set to given values, NULL included.
+        Rows are streamed to database with executemany in chunks of chunk_size rows with bound parameters.
+        If any row fails, whole operation is rolled back.
+
+        :param target_table: target table string name as it is in database.
+        :param key_fields: names of fields to find rows by, f.ex. primary key.
+        :param target_fields: iterable collection of target fields for <tuple> rows.
+        :param rows: iterable collection of <tuple> or <dict> rows, containing key fields.
+        :param chunk_size: amount of rows passed to database at once.
+        :return: BulkReport with amount of updated rows and throughput.
+        """
+        key_fields = tuple(key_fields)
+        target_fields = tuple(target_fields) if target_fields is not None else tuple()
+        started = time.perf_counter()
+        count = 0
+        with self.transaction():
+            for fields, chunk in _internal.shaped_chunks(rows, target_fields, chunk_size, drop_nulls=False):
+                if missing := set(key_fields).difference(fields):
+                    raise KeyError(f'rows to update do not have key fields {missing}')
+                keys = [fields.index(f) for f in key_fields]
+                values = [i for i, f in enumerate(fields) if f not in key_fields]
+                if not values:
+                    continue
+
+                query = (f'UPDATE {target_table} SET {", ".join(f"{fields[i]} = ?" for i in values)} '
+                         f'WHERE {" AND ".join(f"{f} = ?" for f in key_fields)};')
+                chunk = [tuple(row[i] for i in values) + tuple(row[i] for i in keys) for row in chunk]
+                count += self._execute_many(query, chunk, 'update')
+        self.invalidate_results((target_table,))
+
+        return _Report.BulkReport(count, time.perf_counter() - started)
+
+    def upsert(self, target_table: str, conflict_fields: Iterable[str], target_fields: Iterable[str],
+               rows: Iterable[Mapping | Sequence], chunk_size: int = 1000) -> '_Report.BulkReport':
+        """
+        Insert many rows into target table, or update existing ones, within single transaction.
+
+        Rows are inserted with INSERT ... ON CONFLICT DO UPDATE: if row with the same values of conflict fields exists,
+        its other fields are set to given values, NULL included. Conflict fields should have UNIQUE index or be primary key.
+        Rows are streamed to database with executemany in chunks of chunk_size rows with bound parameters.
+        If any row fails, whole operation is rolled back.
+
+        :param target_table: target table string name as it is in database.
+        :param conflict_fields: names of unique fields to detect existing rows by.
+        :param target_fields: iterable collection of target fields for <tuple> rows.
+        :param rows: iterable collection of <tuple> or <dict> rows, containing conflict fields.
+        :param chunk_size: amount of rows passed to database at once.
+        :return: BulkReport with amount of inserted or updated rows and throughput.
+        """
+        conflict_fields = tuple(conflict_fields)
+        target_fields = tuple(target_fields) if target_fields is not None else tuple()
+        started = time.perf_counter()
+        count = 0
+        with self.transaction():
+            for fields, chunk in _internal.shaped_chunks(rows, target_fields, chunk_size, drop_nulls=False):
+                if missing := set(conflict_fields).difference(fields):
+                    raise KeyError(f'rows to upsert do not have conflict fields {missing}')
+                updates = [f for f in fields if f not in conflict_fields]
+                action = f'UPDATE SET {", ".join(f"{f} = excluded.{f}" for f in updates)}' if updates else 'NOTHING'
+
+                query = (f'INSERT INTO {target_table}({",".join(fields)}) VALUES({",".join("?" * len(fields))}) '
+                         f'ON CONFLICT({",".join(conflict_fields)}) DO {action};')
+                count += self._execute_many(query, chunk, 'insert')
+        self.invalidate_results((target_table,))
+
+        return _Report.BulkReport(count, time.perf_counter() - started)
+
+    def _execute_many(self, query: str, chunk: list[tuple], kind: str) -> int:
+        """
+        Execute query for every row of chunk, measuring its time.
+
+        :return: amount of rows changed.
+        """
+        kind = self._before(query, chunk, kind)
+        started = time.perf_counter()
+        self._db_cursor.executemany(query, chunk)
+        rows = self._db_cursor.rowcount if self._db_cursor.rowcount >= 0 else len(chunk)
+        self._observe(query, chunk, time.perf_counter() - started, rows, kind)
+        return rows
+
+    def export_ndjson(self, path: str, tables: Iterable[str] = None, batch_size: int = 1000) -> '_Report.BulkReport':
+        """
+        Write tables to newline delimited JSON file, streaming rows from database.
+
+        Every table is written as {"table": name, "schema": {...}, "bytes": "base64"} line followed by
+        {"table": name, "row": {...}} lines, so file can be loaded back with DBase.import_ndjson.
+        Tables are written in order of foreign keys, so master tables are loaded before their slave ones.
+        BLOB values are written as {"base64": <encoded bytes>} objects, see parsing.row_to_json.
+        Rows are fetched in batches, so memory usage does not depend on database size.
+
+        :param path: path of file to write.
+        :param tables: names of tables to export. By default, all tables except SQLite internal ones.
+        :param batch_size: amount of rows fetched from database at once.
+        :return: BulkReport with amount of exported rows and throughput.
+        """
+        tables = sorted(t for t in self._db_tables if not t.startswith('sqlite_')) if tables is None else list(tables)
+        foreign_fields = {f'{name}.{fk.slave_field.name}': f'{fk.master_field.table.name}.{fk.master_field.name}'
+                          for name in tables for fk in self.table(name).foreign_keys.values()}
+        tables = parsing.foreign_order(tables, foreign_fields)
+
+        started = time.perf_counter()
+        count = 0
+        with open(path, 'w', encoding='utf-8') as file:
+            for name in tables:
+                table = self.table(name)
+                schema = {'table': name, 'schema': parsing.table_to_schema(table), 'bytes': 'base64'}
+                parsing.write_ndjson(file, (schema,))
+                rows = ({'table': name, 'row': parsing.row_to_json(row)}
+                        for row in parsing.table_to_iter(table, batch_size=batch_size))
+                count += parsing.write_ndjson(file, rows)
+
+        return _Report.BulkReport(count, time.perf_counter() - started)
+
+    def import_ndjson(self, path: str, table: str = None, sample: int = 1000,
+                      chunk_size: int = 1000) -> '_Report.BulkReport':
+        """
+        Load newline delimited JSON file into database, streaming rows with bulk inserts.
+
+        File made with DBase.export_ndjson is loaded as is. With table, every line of file is a row of that table.
+        Missing tables are created: with exported schema if there is one, otherwise schema is inferred from the first
+        sample rows, see parsing.seq_to_table. File is read line by line, so memory usage does not depend on its size.
+
+        :param path: path of file to read.
+        :param table: name of table to load plain rows into.
+        :param sample: amount of first rows to infer schema of new table from.
+        :param chunk_size: amount of rows passed to database at once.
+        :return: BulkReport with amount of imported rows and throughput.
+        """
+        started = time.perf_counter()
+        count = 0
+
+        def counted(rows: Iterable[Mapping]) -> Iterator[Mapping]:
+            nonlocal count
+            for row in rows:
+                count += 1
+                yield row
+
+        with open(path, encoding='utf-8') as file:
+            records = parsing.read_ndjson(file)
+            if table is not None:
+                records = ({'table': table, 'row': row} for row in records)
+
+            for name, group in itertools.groupby(records, key=lambda r: r['table']):
+                first = next(group)
+                if 'schema' in first:
+                    if not self.has_table(name):
+                        self.new_table(name, first['schema'])
+                else:
+                    group = itertools.chain((first,), group)
+
+                if first.get('bytes') == 'base64':
+                    rows = (parsing.row_from_json(r['row']) for r in group)
+                else:
+                    rows = (r['row'] for r in group)
+                if self.has_table(name):
+                    self.table(name).INSERT_MANY(counted(rows), chunk_size=chunk_size)
+                else:
+                    parsing.seq_to_table(self, name, counted(rows), sample=sample, chunk_size=chunk_size)
+
+        return _Report.BulkReport(count, time.perf_counter() - started)
 
     def drop(self, target_table: str, suppress_nonexisting=False) -> None:
         """
@@ -115,6 +812,13 @@ class DBase:
         """
         self.query(f'DROP TABLE {target_table} {"IF EXISTS" if suppress_nonexisting else ""};')
 
+        self._schema.invalidate(target_table)
+        self._active_tables.pop(target_table, None)
+        self._composites.clear()
+        self._recent_composites.clear()
+        self.invalidate_results((target_table,))
+        self._db_tables = self.get_tables()
+
     def has_tables(self, tables: Iterable[Union[str, '_Table.Table']]) -> bool:
         """
         Check if all given tables are present in database.
@@ -208,17 +912,25 @@ class DBase:
         """
         Get fields for of given table.
 
+        Fields of real tables are cached in DBase.schema.
+
         :param table: Table reference object.
         :return: dict of {field_name: TableField object}
         """
-        result = self.query(f'PRAGMA table_info({table.query})').fetchall()
-        fks = self.query(f'PRAGMA foreign_key_list({table.query})').fetchall()
+        if table.is_real:
+            if (cached := self._schema.fields.get(table.name)) is not None:
+                return cached.copy()
+            result = self._schema.table_info(table.name)
+            fks = self._schema.foreign_key_list(table.name)
+        else:
+            result = self.query(f'PRAGMA table_info({table.query})').fetchall()
+            fks = self.query(f'PRAGMA foreign_key_list({table.query})').fetchall()
         fields = dict()
-        for i, name, typ, nullable, default, pk in result:
+        for i, name, typ, notnull, default, pk in result:
             constraints = []
             if pk != 0:
                 constraints.append(_Constr.Primary(pk))
-            if not nullable:
+            if notnull:
                 constraints.append(_Constr.NotNull())
             if default:
                 constraints.append(_Constr.Default(default))
@@ -230,16 +942,25 @@ class DBase:
             slave_field = fk[3]
             fields[f'{table.name}.{slave_field}'].constraints.append(_Constr.Foreign(f'{master_name}.{master_field}'))
 
+        if table.is_real:
+            self._schema.fields[table.name] = fields.copy()
         return fields
 
     def table_foreign_keys(self, table: '_Table.Table') -> dict[str, '_Table.TableFK']:
         """
         Get foreign keys for of given table.
 
+        Foreign keys of real tables are cached in DBase.schema.
+
         :param table: Table reference object.
         :return: dict of {field_name: TableFK object}
         """
-        result = self.query(f'PRAGMA foreign_key_list({table.query})').fetchall()
+        if table.is_real:
+            if (cached := self._schema.foreign_keys.get(table.name)) is not None:
+                return cached.copy()
+            result = self._schema.foreign_key_list(table.name)
+        else:
+            result = self.query(f'PRAGMA foreign_key_list({table.query})').fetchall()
         keys = dict()
 
         for f in result:
@@ -247,8 +968,61 @@ class DBase:
             fk = _Table.TableFK(master.field_by_name(f[4]), table.field_by_name(f[3]))
             keys[f'{table.name}.{fk.slave_field.name}'] = fk
 
+        if table.is_real:
+            self._schema.foreign_keys[table.name] = keys.copy()
         return keys
 
+    def table_indexes(self, table: '_Table.Table') -> dict[str, '_Table.TableIndex']:
+        """
+        Get indexes of given table.
+
+        Fields of index on expressions, f.ex. lower(name), end before the first expression,
+        so index on expressions only has no fields and covers no field.
+
+        :param table: Table reference object.
+        :return: dict of {index_name: TableIndex object}
+        """
+        indexes = dict()
+        for rqt in table.binded:
+            columns = dict()
+            expressions = set()
+            for index_name, unique, origin, column in self._schema.index_list(rqt.name):
+                fields = columns.setdefault((index_name, unique, origin), [])
+                if column is None:
+                    expressions.add(index_name)
+                elif index_name not in expressions:
+                    fields.append(rqt.field_by_name(column))
+            for (index_name, unique, origin), fields in columns.items():
+                indexes[index_name] = _Table.TableIndex(index_name, fields, bool(unique), origin)
+        return indexes
+
+    def create_index(self, target_table: str, target_fields: Iterable[str], unique=False, index_name: str = None) -> str:
+        """
+        Create index on fields of target table.
+
+        :param target_table: target table string name as it is in database.
+        :param target_fields: iterable collection of field names to index.
+        :param unique: True means to create UNIQUE index.
+        :param index_name: name for new index. By default, it is made from table and field names.
+        :return: name of index.
+        """
+        target_fields = tuple(target_fields)
+        index_name = index_name if index_name is not None else f'idx_{target_table}_{"_".join(target_fields)}'
+        self.query(f'CREATE {"UNIQUE " if unique else ""}INDEX IF NOT EXISTS {index_name} '
+                   f'ON {target_table}({",".join(target_fields)});', commit=True)
+        self._schema.invalidate_indexes()
+        return index_name
+
+    def drop_index(self, index_name: str, suppress_nonexisting=False) -> None:
+        """
+        Drop index from current DBase.
+
+        :param index_name: index name as it is in sqlite base.
+        :param suppress_nonexisting: True -- add 'IF EXISTS', so no error on index is not in db
+        """
+        self.query(f'DROP INDEX {"IF EXISTS " if suppress_nonexisting else ""}{index_name};', commit=True)
+        self._schema.invalidate_indexes()
+
     @property
     def name(self) -> str:
         """Name of current DBase's file."""
@@ -259,6 +1033,36 @@ class DBase:
         """All tables present in current DBase's file."""
         return self._db_tables
 
+    @property
+    def is_threaded(self) -> bool:
+        """Is every thread using its own connection to database."""
+        return self._threaded
+
+    @property
+    def schema(self) -> '_Schema.SchemaCatalog':
+        """Cached schema metadata of database tables."""
+        return self._schema
+
+    @property
+    def slow_query_log(self) -> Union['_Profiling.SlowQueryLog', None]:
+        """Log of slow queries, if it is enabled with DBase.enable_slow_query_log."""
+        return self._slow_query_log
+
+    @property
+    def index_advisor(self) -> Union['_Advisor.IndexAdvisor', None]:
+        """IndexAdvisor recording queries, if it is enabled with DBase.enable_index_advisor."""
+        return self._index_advisor
+
+    @property
+    def result_cache(self) -> Union['_Cache.ResultCache', None]:
+        """Cache of SelectQuery results, if it is enabled with DBase.enable_result_cache."""
+        return self._result_cache
+
+    @property
+    def sql_cache(self) -> '_Cache.LRUCache':
+        """Cache of compiled SQL texts of queries by their shapes."""
+        return self._sql_cache
+
     @property
     def active_tables(self) -> dict[str, '_Table.Table']:
         """All Table objects initialized within DBase."""
@@ -267,6 +1071,14 @@ class DBase:
     def __repr__(self) -> str:
         return f'DBase<{self.name}>'
 
+    def close(self) -> None:
+        """Close all connections to database, opened by this DBase."""
+        with self._connections_lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+        self._local = threading.local()
+
     def __del__(self):
-        self._db_cursor.close()
-        self._db_connection.close()
+        if hasattr(self, '_connections_lock'):
+            self.close()
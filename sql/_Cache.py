@@ -0,0 +1,201 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Iterable
+
+
+class LRUCache:
+    """
+    Least recently used cache with limited size and hit/miss counters.
+
+    Cache is safe to share between threads.
+    """
+    def __init__(self, maxsize: int = 256):
+        self._maxsize = maxsize
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get cached value and mark it as recently used.
+
+        :param key: cache key.
+        :param default: value to return if key is not cached.
+        :return: cached value or default.
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Cache value, evicting least recently used values above maxsize.
+
+        :param key: cache key.
+        :param value: value to cache.
+        """
+        if self._maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached values and reset counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        """Maximum amount of cached values."""
+        return self._maxsize
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f'LRUCache<{len(self)}/{self.maxsize}, hits={self.hits}, misses={self.misses}>'
+
+
+class ResultCache:
+    """
+    Cache of query results with LRU and TTL eviction, memory budget and invalidation by tables.
+
+    Every result is stored with names of tables it was selected from.
+    When table is changed, all results selected from it are dropped.
+    Cache is safe to share between threads.
+    """
+    def __init__(self, maxsize: int = 256, ttl: float = None, max_bytes: int = None):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        self._data: OrderedDict[Hashable, tuple[list, frozenset[str], float | None, int]] = OrderedDict()
+        self._by_table: dict[str, set[Hashable]] = dict()
+        self._bytes = 0
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _rows_size(rows: list[tuple]) -> int:
+        """Approximate memory size of result rows."""
+        size = sys.getsizeof(rows)
+        for row in rows:
+            size += sys.getsizeof(row)
+            for value in row:
+                size += sys.getsizeof(value)
+        return size
+
+    def _remove(self, key: Hashable) -> None:
+        rows, tables, expires, size = self._data.pop(key)
+        self._bytes -= size
+        for table in tables:
+            if (keys := self._by_table.get(table)) is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_table[table]
+
+    def get(self, key: Hashable) -> list[tuple] | None:
+        """
+        Get cached result and mark it as recently used.
+
+        :param key: cache key.
+        :return: cached rows or None if result is not cached or expired.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if (entry is not None) and (entry[2] is not None) and (entry[2] <= time.monotonic()):
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, rows: list[tuple], tables: Iterable[str], generation: int) -> None:
+        """
+        Cache result rows.
+
+        Result is not cached, if any table was changed since given generation, or if it does not fit memory budget.
+
+        :param key: cache key.
+        :param rows: result rows.
+        :param tables: names of tables result was selected from.
+        :param generation: cache generation got before result was selected.
+        """
+        size = self._rows_size(rows) if self._max_bytes is not None else 0
+        if (self._maxsize <= 0) or ((self._max_bytes is not None) and (size > self._max_bytes)):
+            return
+
+        tables = frozenset(tables)
+        expires = time.monotonic() + self._ttl if self._ttl is not None else None
+        with self._lock:
+            if generation != self._generation:
+                return
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (rows, tables, expires, size)
+            self._bytes += size
+            for table in tables:
+                self._by_table.setdefault(table, set()).add(key)
+
+            while (len(self._data) > self._maxsize) or \
+                    ((self._max_bytes is not None) and (self._bytes > self._max_bytes)):
+                self._remove(next(iter(self._data)))
+
+    def invalidate(self, tables: Iterable[str]) -> None:
+        """
+        Drop all results selected from given tables.
+
+        :param tables: names of changed tables.
+        """
+        with self._lock:
+            self._generation += 1
+            for table in tables:
+                for key in tuple(self._by_table.get(table, ())):
+                    self._remove(key)
+
+    def clear(self) -> None:
+        """Drop all cached results and reset counters."""
+        with self._lock:
+            self._generation += 1
+            self._data.clear()
+            self._by_table.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def generation(self) -> int:
+        """Counter of invalidations, used to detect changes made while result was selected."""
+        return self._generation
+
+    @property
+    def bytes(self) -> int:
+        """Approximate memory size of cached results. Counted only if max_bytes is set."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f'ResultCache<{len(self)}/{self._maxsize}, hits={self.hits}, misses={self.misses}>'
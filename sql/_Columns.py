@@ -0,0 +1,113 @@
+import array
+from typing import Iterable, Sequence, Union
+
+from . import _Table
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+AGGREGATE_KINDS = {'COUNT': 'int', 'AVG': 'float'}
+
+
+def column_kind(field: Union['_Table.TableField', '_Table.CalculatedField']) -> str:
+    """
+    Get kind of column values by field declared type, following SQLite type affinity rules.
+
+    :param field: selected field.
+    :return: 'int', 'float' or 'object'.
+    """
+    if isinstance(field, _Table.CalculatedField) and (field.function in AGGREGATE_KINDS):
+        return AGGREGATE_KINDS[field.function]
+
+    typ = (field.type or "").upper()
+    if 'INT' in typ:
+        return 'int'
+    if any(t in typ for t in ('CHAR', 'CLOB', 'TEXT', 'BLOB')) or not typ:
+        return 'object'
+    return 'float'
+
+
+class Column:
+    """
+    Column object accumulates values of one selected field in typed array.
+
+    NumPy arrays are used if NumPy is installed (int64, float64 or object), otherwise array.array ('q' or 'd') or list.
+    SQLite does not enforce column types, so column is widened when value does not fit:
+    integer column with NULL becomes float one with NaN, column with text becomes object one.
+    """
+    def __init__(self, kind: str):
+        self.kind = kind
+        self._chunks = []
+        self._values = self._new_values(kind)
+
+    @staticmethod
+    def _new_values(kind: str) -> array.array | list:
+        if kind == 'int':
+            return array.array('q')
+        if kind == 'float':
+            return array.array('d')
+        return list()
+
+    @staticmethod
+    def _nan(values: Iterable) -> list:
+        return [float('nan') if v is None else v for v in values]
+
+    def extend(self, values: Sequence) -> None:
+        """Add batch of values to column."""
+        if numpy is not None:
+            self._extend_numpy(values)
+        else:
+            self._extend_array(values)
+
+    def _extend_numpy(self, values: Sequence) -> None:
+        chunk = numpy.array(values)
+        if (self.kind == 'int') and (chunk.dtype.kind not in 'iub'):
+            self._widen()
+        if (self.kind == 'float') and (chunk.dtype.kind not in 'iubf'):
+            if all((v is None) or isinstance(v, (int, float)) for v in values):
+                chunk = numpy.array(values, dtype=numpy.float64)
+            else:
+                self._widen()
+
+        if self.kind == 'int':
+            chunk = chunk.astype(numpy.int64)
+        elif self.kind == 'float':
+            chunk = chunk.astype(numpy.float64)
+        else:
+            chunk = numpy.empty(len(values), dtype=object)
+            chunk[:] = values
+        self._chunks.append(chunk)
+
+    def _extend_array(self, values: Sequence) -> None:
+        size = len(self._values)
+        while True:
+            try:
+                if self.kind == 'float':
+                    self._values.extend(self._nan(values))
+                else:
+                    self._values.extend(values)
+                return
+            except (TypeError, OverflowError):
+                del self._values[size:]
+                self._widen()
+
+    def _widen(self) -> None:
+        """Change column kind to the next wider one: int -> float -> object."""
+        self.kind = 'float' if self.kind == 'int' else 'object'
+        if numpy is not None:
+            self._chunks = [c.astype(numpy.float64 if self.kind == 'float' else object) for c in self._chunks]
+        else:
+            values = self._new_values(self.kind)
+            values.extend(iter(self._values))
+            self._values = values
+
+    def result(self):
+        """Get accumulated values as single array."""
+        if numpy is None:
+            return self._values
+        if not self._chunks:
+            return numpy.empty(0, dtype={'int': numpy.int64, 'float': numpy.float64}.get(self.kind, object))
+        return self._chunks[0] if len(self._chunks) == 1 else numpy.concatenate(self._chunks)
@@ -0,0 +1,83 @@
+import collections
+import functools
+import itertools
+import multiprocessing
+from typing import Iterable, Iterator, Sequence
+
+
+def to_int(value: str) -> int | float | str | None:
+    """Convert CSV cell of INTEGER field. Empty cell is NULL, not a number is kept as is."""
+    if value == '':
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return to_float(value)
+
+
+def to_float(value: str) -> float | str | None:
+    """Convert CSV cell of REAL field. Empty cell is NULL, not a number is kept as is."""
+    if value == '':
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def to_object(value: str) -> str:
+    """Keep CSV cell of TEXT or not typed field as is."""
+    return value
+
+
+CONVERTERS = {'int': to_int, 'float': to_float, 'object': to_object}
+
+
+def coerce_chunk(kinds: Sequence[str], chunk: list[Sequence[str]]) -> list[tuple]:
+    """
+    Convert CSV rows to values of field kinds.
+
+    :param kinds: kinds of fields, see _Columns.column_kind.
+    :param chunk: list of CSV rows. Missing cells are NULL.
+    :return: list of converted rows.
+    """
+    converters = [CONVERTERS[k] for k in kinds]
+    width = len(converters)
+    result = []
+    for row in chunk:
+        if len(row) < width:
+            row = list(row) + [''] * (width - len(row))
+        result.append(tuple(c(v) for c, v in zip(converters, row)))
+    return result
+
+
+def coerced(rows: Iterable[Sequence[str]], kinds: Sequence[str], chunk_size: int,
+            processes: int = None) -> Iterator[tuple]:
+    """
+    Lazily convert CSV rows to values of field kinds.
+
+    With processes, chunks of rows are converted by pool of processes. Only a few chunks per process are sent
+    to pool at once, so memory usage does not depend on amount of rows. Order of rows is kept.
+
+    :param rows: CSV rows, f.ex. csv.reader.
+    :param kinds: kinds of fields, see _Columns.column_kind.
+    :param chunk_size: amount of rows converted at once.
+    :param processes: amount of processes to convert rows. None means to convert in current process.
+    :return: iterator of converted rows.
+    """
+    rows = iter(rows)
+    chunks = iter(lambda: list(itertools.islice(rows, chunk_size)), [])
+    convert = functools.partial(coerce_chunk, tuple(kinds))
+    if not processes:
+        for chunk in chunks:
+            yield from convert(chunk)
+        return
+
+    with multiprocessing.Pool(processes) as pool:
+        pending = collections.deque()
+        for chunk in chunks:
+            pending.append(pool.apply_async(convert, (chunk,)))
+            if len(pending) >= 2 * processes:
+                yield from pending.popleft().get()
+        while pending:
+            yield from pending.popleft().get()
@@ -0,0 +1,59 @@
+from typing import Mapping, Any
+
+
+# Order matters: page_size has to be set before database is switched to WAL.
+PRAGMAS = ('page_size', 'journal_mode', 'synchronous', 'cache_size', 'mmap_size', 'temp_store')
+
+PROFILES: dict[str, dict[str, Any]] = {
+    # SQLite defaults
+    'default': {
+        'journal_mode': 'DELETE',
+        'synchronous': 'FULL',
+        'cache_size': -2000,
+        'mmap_size': 0,
+        'temp_store': 'DEFAULT',
+    },
+    # Fast imports: journal in memory and no fsync. Changes may be lost or database corrupted on power loss.
+    'bulk_load': {
+        'page_size': 32768,
+        'journal_mode': 'MEMORY',
+        'synchronous': 'OFF',
+        'cache_size': -262144,
+        'mmap_size': 0,
+        'temp_store': 'MEMORY',
+    },
+    # Concurrent reads: WAL, big page cache and memory-mapped database file.
+    'read_heavy': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -65536,
+        'mmap_size': 1 << 30,
+        'temp_store': 'MEMORY',
+    },
+    # Every commit survives power loss.
+    'durable': {
+        'journal_mode': 'WAL',
+        'synchronous': 'FULL',
+        'cache_size': -16384,
+        'mmap_size': 0,
+        'temp_store': 'DEFAULT',
+    },
+}
+
+
+def profile_pragmas(profile: str | Mapping[str, Any]) -> dict[str, Any]:
+    """
+    Get PRAGMA values of profile.
+
+    :param profile: profile name from PROFILES or mapping of {PRAGMA name: value}.
+    :return: dict of {PRAGMA name: value} in order they have to be set.
+    """
+    if isinstance(profile, str):
+        try:
+            profile = PROFILES[profile]
+        except KeyError:
+            raise ValueError(f'unknown profile {profile}, expected one of {tuple(PROFILES)}') from None
+
+    if unknown := set(profile).difference(PRAGMAS):
+        raise ValueError(f'unsupported PRAGMAs {unknown}, expected some of {PRAGMAS}')
+    return {p: profile[p] for p in PRAGMAS if p in profile}
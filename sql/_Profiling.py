@@ -0,0 +1,232 @@
+import re
+import threading
+from collections import deque
+from typing import Iterable, Iterator, Sequence, Mapping, Any
+
+
+class PlanNode:
+    """PlanNode object represents one step of SQLite query plan."""
+    _index_pattern = re.compile(r'USING (?:COVERING )?INDEX (\S+)|USING (INTEGER PRIMARY KEY)')
+
+    def __init__(self, i: int, parent: int, detail: str):
+        self.id = i
+        self.parent = parent
+        self.detail = detail
+        self.children: list['PlanNode'] = []
+
+    @property
+    def is_scan(self) -> bool:
+        """Is this step a full scan of table."""
+        return self.detail.startswith('SCAN')
+
+    @property
+    def is_search(self) -> bool:
+        """Is this step a search in table by index or primary key."""
+        return self.detail.startswith('SEARCH')
+
+    @property
+    def table(self) -> str | None:
+        """Name of table scanned or searched by this step."""
+        if not (self.is_scan or self.is_search):
+            return None
+        words = self.detail.split()
+        return words[2] if (len(words) > 2) and (words[1] == 'TABLE') else words[1]
+
+    @property
+    def index(self) -> str | None:
+        """Name of index used by this step, or 'INTEGER PRIMARY KEY'."""
+        if (match := self._index_pattern.search(self.detail)) is not None:
+            return match.group(1) or match.group(2)
+        return None
+
+    def __repr__(self) -> str:
+        return f'PlanNode<{self.detail}>'
+
+
+class QueryPlan:
+    """QueryPlan object represents parsed result of EXPLAIN QUERY PLAN."""
+    def __init__(self, rows: Iterable[tuple]):
+        self.nodes: list[PlanNode] = []
+        self.roots: list[PlanNode] = []
+        by_id = dict()
+        for i, parent, _, detail in rows:
+            node = PlanNode(i, parent, detail)
+            self.nodes.append(node)
+            by_id[i] = node
+            if parent in by_id:
+                by_id[parent].children.append(node)
+            else:
+                self.roots.append(node)
+
+    @property
+    def scans(self) -> list[PlanNode]:
+        """Steps which are full scans of tables."""
+        return [n for n in self.nodes if n.is_scan]
+
+    @property
+    def searches(self) -> list[PlanNode]:
+        """Steps which are searches in tables by index or primary key."""
+        return [n for n in self.nodes if n.is_search]
+
+    @property
+    def has_full_scan(self) -> bool:
+        return bool(self.scans)
+
+    def _lines(self, nodes: list[PlanNode], depth: int) -> Iterator[str]:
+        for node in nodes:
+            yield f'{"  " * depth}{node.detail}'
+            yield from self._lines(node.children, depth + 1)
+
+    def __str__(self) -> str:
+        return "\n".join(self._lines(self.roots, 0))
+
+    def __repr__(self) -> str:
+        return f'QueryPlan<{"; ".join(n.detail for n in self.nodes)}>'
+
+
+class SlowQuery:
+    """SlowQuery object describes query which took longer than SlowQueryLog threshold."""
+    def __init__(self, query: str, params: Sequence | Mapping, seconds: float, rows: int | None,
+                 plan: QueryPlan | None):
+        self.query = query
+        self.params = params
+        self.seconds = seconds
+        self.rows = rows
+        self.plan = plan
+
+    def __repr__(self) -> str:
+        return f'SlowQuery<{self.seconds:.3f}s, {self.rows} rows: {" ".join(self.query.split())}>'
+
+
+class SlowQueryLog:
+    """
+    SlowQueryLog keeps last queries which took longer than threshold.
+    """
+    def __init__(self, threshold: float, maxlen: int = 1000, explain: bool = True):
+        self.threshold = threshold
+        self.explain = explain
+        self._entries: deque[SlowQuery] = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def record(self, entry: SlowQuery) -> None:
+        with self._lock:
+            self._entries.append(entry)
+
+    @property
+    def entries(self) -> list[SlowQuery]:
+        """Recorded slow queries, the oldest go first."""
+        with self._lock:
+            return list(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __iter__(self) -> Iterator[SlowQuery]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f'SlowQueryLog<{len(self)} queries over {self.threshold}s>'
+
+
+class QueryEvent:
+    """
+    QueryEvent object describes query made through DBase. It is passed to query hooks.
+
+    Kind is a calling query type: 'SelectQuery', 'UpdateQuery', 'DeleteQuery', 'insert', 'ddl',
+    or lowercase SQL command for other queries.
+    Seconds and rows are None for hooks called before query.
+    """
+    def __init__(self, query: str, params: Sequence | Mapping, kind: str,
+                 seconds: float | None = None, rows: int | None = None):
+        self.query = query
+        self.params = params
+        self.kind = kind
+        self.seconds = seconds
+        self.rows = rows
+
+    def __repr__(self) -> str:
+        return f'QueryEvent<{self.kind}, {self.seconds}s, {self.rows} rows: {" ".join(self.query.split())}>'
+
+
+class QueryStats:
+    """
+    QueryStats aggregates latency of queries by their shape, i.e. SQL text with '?' placeholders.
+
+    For every shape the last window durations are kept to calculate percentiles.
+    Use it as DBase query hook, see DBase.enable_query_stats.
+    """
+    def __init__(self, window: int = 1000):
+        self._window = window
+        self._samples: dict[str, deque[float]] = dict()
+        self._counts: dict[str, int] = dict()
+        self._totals: dict[str, float] = dict()
+        self._kinds: dict[str, str] = dict()
+        self._lock = threading.Lock()
+
+    def __call__(self, event: QueryEvent) -> None:
+        with self._lock:
+            if (samples := self._samples.get(event.query)) is None:
+                samples = self._samples[event.query] = deque(maxlen=self._window)
+                self._counts[event.query] = 0
+                self._totals[event.query] = 0.0
+                self._kinds[event.query] = event.kind
+            samples.append(event.seconds)
+            self._counts[event.query] += 1
+            self._totals[event.query] += event.seconds
+
+    @staticmethod
+    def _percentile(ordered: list[float], p: float) -> float:
+        return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))]
+
+    def percentiles(self, query: str, ps: Iterable[float] = (50, 95, 99)) -> dict[float, float]:
+        """
+        Get latency percentiles of query shape over the last window calls.
+
+        :param query: query shape, i.e. SQL text.
+        :param ps: percentiles to calculate.
+        :return: dict of {percentile: seconds}
+        """
+        with self._lock:
+            ordered = sorted(self._samples[query])
+        return {p: self._percentile(ordered, p) for p in ps}
+
+    def report(self) -> dict[str, dict[str, Any]]:
+        """
+        Get statistics of all query shapes.
+
+        :return: dict of {SQL text: {kind, count, total, p50, p95, p99}}
+        """
+        with self._lock:
+            shapes = [(q, self._kinds[q], self._counts[q], self._totals[q], sorted(s)) for q, s in self._samples.items()]
+        return {q: {'kind': kind, 'count': count, 'total': total,
+                    'p50': self._percentile(ordered, 50),
+                    'p95': self._percentile(ordered, 95),
+                    'p99': self._percentile(ordered, 99)}
+                for q, kind, count, total, ordered in shapes}
+
+    def top(self, n: int = 10, by: str = 'total') -> list[tuple[str, dict[str, Any]]]:
+        """
+        Get the hottest query shapes.
+
+        :param n: amount of shapes.
+        :param by: statistic to sort by: 'total', 'count', 'p50', 'p95' or 'p99'.
+        :return: list of (SQL text, statistics), the hottest go first.
+        """
+        return sorted(self.report().items(), key=lambda item: item[1][by], reverse=True)[:n]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
+            self._totals.clear()
+            self._kinds.clear()
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def __repr__(self) -> str:
+        return f'QueryStats<{len(self)} query shapes>'
@@ -1,8 +1,15 @@
-from typing import Iterable, Union, Type
+import csv
+import itertools
+import time
+from typing import Iterable, Iterator, Union, Type, Sequence, Mapping
 from . import _Table
 from . import _Where
 from . import _internal
 from . import _exceptions
+from . import _Profiling
+from . import _Columns
+from . import template
+from . import _Report
 
 
 class DeleteQuery:
@@ -17,20 +24,37 @@ class DeleteQuery:
         if not self._target.is_real:
             raise _exceptions.TableIsNotReal(self._target.name)
 
-    def __call__(self, commit=True) -> None:
+    def __call__(self, commit=True, **values) -> None:
         """
         Make SQL DELETE Query, which presented by current object.
 
         :param commit: True means to commit changes to database after query success
+        :param values: values for template.Param placeholders by their names.
         """
-        query = str(self)
-        self._target.db.query(query, commit=commit)
+        if (advisor := self._target.db.index_advisor) is not None:
+            advisor.record(self._target, self._where)
+        query, params = self.compile()
+        params = template.bind(params, values)
+        self._target.db.query(query, commit=commit, params=params, kind='DeleteQuery')
+        self._target.db.invalidate_results(t.name for t in self._target.binded)
+
+    def compile(self) -> tuple[str, tuple]:
+        """
+        Compile current object to SQL text with '?' placeholders.
 
-    def __str__(self) -> str:
+        :return: (SQL text, tuple of parameters to bind).
+        """
+        where, params = self._where.compile() if self._where is not None else (None, tuple())
+        return self._render(where), params
+
+    def _render(self, where: str | None) -> str:
         delete = f'DELETE FROM {self._target.name}'
-        where = f' WHERE {self._where}' if self._where is not None else ""
+        where = f' WHERE {where}' if where is not None else ""
         return f"{delete}{where}"
 
+    def __str__(self) -> str:
+        return self._render(str(self._where) if self._where is not None else None)
+
     def __repr__(self) -> str:
         return str(self)
 
@@ -53,32 +77,57 @@ class UpdateQuery:
         if not isinstance(values, dict) and ((lv := len(values)) != (lf := len(self._fields))):
             raise ValueError(f'All fields from selection have to be initialized in UPDATE query, but only {lv} of {lf} are.')
 
-    def __call__(self, commit=True) -> None:
+    def __call__(self, commit=True, **values) -> None:
         """
         Make SQL UPDATE Query, which is presented by current object.
 
         :param commit: True means to commit changes to database after query success.
+        :param values: values for template.Param placeholders by their names.
         """
-        query = str(self)
-        self._target.db.query(query, commit=commit)
-
-    def __str__(self) -> str:
+        if (advisor := self._target.db.index_advisor) is not None:
+            advisor.record(self._target, self._where)
+        query, params = self.compile()
+        params = template.bind(params, values)
+        self._target.db.query(query, commit=commit, params=params, kind='UpdateQuery')
+        self._target.db.invalidate_results(t.name for t in self._target.binded)
+
+    def _assignments(self) -> tuple[tuple[str, ...], tuple]:
+        """Get assigned field names and assigned values."""
         if isinstance(self._values, tuple):
-            fields = (f.name for f in self._fields)
+            fields = tuple(f.name for f in self._fields)
             values = self._values
         elif isinstance(self._values, dict):
-            fields = (self._target.field_by_name(f).name for f in self._values.keys())
-            values = self._values.values()
+            fields = tuple(self._target.field_by_name(f).name for f in self._values.keys())
+            values = tuple(self._values.values())
         else:
             raise TypeError(f'expected <dict> or <tuple> for value assignment, got {type(self._values)}')
+        return fields, values
+
+    def compile(self) -> tuple[str, tuple]:
+        """
+        Compile current object to SQL text with '?' placeholders.
 
+        :return: (SQL text, tuple of parameters to bind).
+        """
+        fields, values = self._assignments()
+        where, where_params = self._where.compile() if self._where is not None else (None, tuple())
+        having, having_params = self._having.compile() if self._having else (None, tuple())
+        return self._render(fields, ("?",) * len(fields), where, having), values + where_params + having_params
+
+    def _render(self, fields: tuple[str, ...], values: Iterable[str], where: str | None, having: str | None) -> str:
         update = f'''UPDATE
-        {self._target.name} SET {",".join(fields)} = ({",".join(_internal.proper_values(values))})'''
-        where = f' WHERE {self._where}' if self._where is not None else ""
+        {self._target.name} SET {",".join(f"{f} = {v}" for f, v in zip(fields, values))}'''
+        where = f' WHERE {where}' if where is not None else ""
         group = f' GROUP BY {",".join(f.full_name for f in self._group)}' if self._group else ""
-        having = f' HAVING {self._having}' if self._having else ""
+        having = f' HAVING {having}' if having else ""
         return f'{update}{where}{group}{having};'
 
+    def __str__(self) -> str:
+        fields, values = self._assignments()
+        return self._render(fields, _internal.proper_values(values),
+                            str(self._where) if self._where is not None else None,
+                            str(self._having) if self._having else None)
+
     def __repr__(self) -> str:
         return str(self)
 
@@ -97,7 +146,12 @@ class SelectQuery:
         self._union_comparator = _Where.WhereAND
         self._group: tuple['_Table.TableField'] = tuple()
         self._order: tuple['_Table.TableField'] = tuple()
-
+        self._after: _Where.WhereRowGt | None = None
+        self._limit: int | None = None
+        self._offset: int | None = None
+        self._shape = None
+        self._compiled = None
+        self._is_template = False
 
     @property
     def union_comparator(self) -> Type['_Where.WhereComposition']:
@@ -125,6 +179,19 @@ class SelectQuery:
     def order_fields(self) -> tuple['_Table.TableField']:
         return self._order
 
+    @property
+    def after_condition(self) -> '_Where.WhereRowGt | None':
+        """Keyset pagination condition, see SelectQuery.after."""
+        return self._after
+
+    @property
+    def limit(self) -> int | None:
+        return self._limit
+
+    @property
+    def offset(self) -> int | None:
+        return self._offset
+
     @property
     def source(self) -> '_Table.Table':
         """Source Table object to SELECT from."""
@@ -135,6 +202,28 @@ class SelectQuery:
         """Fields used in current selection."""
         return self._fields
 
+    @property
+    def shape(self) -> tuple:
+        """
+        Hashable shape of current query.
+
+        Queries of the same shape compile to the same SQL text and differ only in bound parameters.
+        """
+        if self._shape is None:
+            self._shape = (
+                self._source.query,
+                self._distinct,
+                tuple(f.shape for f in self._fields),
+                self._where.shape() if self._where else None,
+                self._having.shape() if self._having else None,
+                tuple(f.shape for f in self._group),
+                tuple(f.shape for f in self._order),
+                self._after.shape() if self._after else None,
+                self._limit is not None,
+                self._offset is not None,
+            )
+        return self._shape
+
     @property
     def body(self):
         """Last query operation result. Used for caching."""
@@ -179,13 +268,16 @@ class SelectQuery:
 
         new_wheres = []
         new_havings = []
-        for value, field in zip(_internal.proper_values(values), self.fields):
+        for value, field in zip(values, self.fields):
             if (value == tuple()) or (value == list()):
                 continue
-            if isinstance(value, tuple):
-                new_condition = _Where.WhereOR(*(comparison(field, v) for v in _internal.proper_values(value)))
+            if isinstance(value, tuple) and (comparison is _Where.WhereEq) and (len(value) > 1) and not any(
+                    isinstance(v, Union[_Table.TableField, _Table.CalculatedField]) for v in value):
+                new_condition = _Where.WhereIn(field, value)
+            elif isinstance(value, tuple):
+                new_condition = _Where.WhereOR(*(comparison(field, v) for v in value))
             elif isinstance(value, list):
-                new_condition = _Where.WhereAND(*(comparison(field, v) for v in _internal.proper_values(value)))
+                new_condition = _Where.WhereAND(*(comparison(field, v) for v in value))
             else:
                 new_condition = comparison(field, value)
 
@@ -227,6 +319,109 @@ class SelectQuery:
         new._order = fields
         return new
 
+    def LIMIT(self, limit: int, offset: int = None) -> 'SelectQuery':
+        """
+        Make new SelectQuery, which is copy of current, but selects at most limit rows, skipping offset rows.
+
+        Skipped rows are still read by database, so for deep pages use keyset pagination, see SelectQuery.after.
+
+        :param limit: maximum amount of rows to select.
+        :param offset: amount of rows to skip.
+        :return: new SelectQuery object.
+        """
+        new = self.copy()
+        new._limit = int(limit)
+        new._offset = int(offset) if offset is not None else None
+        return new
+
+    def after(self, last_row: Sequence | Mapping = None, values: Sequence = None) -> 'SelectQuery':
+        """
+        Make new SelectQuery, which is copy of current, but selects only rows going after last_row in ORDERBY order.
+
+        It is keyset pagination: condition (a, b) > (?, ?) on ordering fields replaces OFFSET,
+        so with index on ordering fields every page costs the same regardless of its depth.
+        Ordering fields should identify row uniquely, f.ex. end with primary key, otherwise equal rows are skipped.
+        Previous keyset condition is replaced.
+
+        :param last_row: last row of previous page as selected by this query, all ordering fields should be selected;
+        or dict of {ordering field name: value}.
+        :param values: values of ordering fields in ORDERBY order, use it instead of last_row,
+        when ordering fields are not selected.
+        :return: new SelectQuery object.
+        """
+        if not self._order:
+            raise ValueError('keyset pagination requires ordering fields, use ORDERBY first')
+        if (last_row is None) == (values is None):
+            raise ValueError('expected either last_row or values')
+
+        if values is not None:
+            if len(values) != len(self._order):
+                raise ValueError(f'expected {len(self._order)} ordering fields values, got {len(values)}')
+            values = tuple(values)
+        elif isinstance(last_row, Mapping):
+            values = tuple(last_row[name] for name in self._keyset_names(last_row))
+        else:
+            if len(last_row) != len(self._fields):
+                raise ValueError(f'expected selected row of {len(self._fields)} values, got {len(last_row)}')
+            values = tuple(last_row[i] for i in self._order_indexes())
+
+        new = self.copy()
+        new._after = _Where.WhereRowGt(self._order, values)
+        return new
+
+    def _order_indexes(self) -> list[int]:
+        """Get positions of ordering fields in selected fields, see SelectQuery._selected_index."""
+        indexes = []
+        for o in self._order:
+            if (i := self._selected_index(o)) is None:
+                raise ValueError(f'ordering field {o.full_name} is not selected, pass its values with after(values=...)')
+            indexes.append(i)
+        return indexes
+
+    def _selected_index(self, field: Union['_Table.TableField', '_Table.CalculatedField']) -> int | None:
+        """
+        Get position of field in selected fields or None if it is not selected.
+
+        Fields are matched by identity or by equality of fields of the same type,
+        so aggregate like COUNT(id) does not match field id.
+        """
+        for i, f in enumerate(self._fields):
+            if (f is field) or ((type(f) is type(field)) and (f == field)):
+                return i
+        return None
+
+    def _keyset_names(self, row: Mapping) -> list[str]:
+        """Get keys of row dict for every ordering field: either field name or its full name."""
+        names = []
+        for f in self._order:
+            for name in (f.full_name, f.name):
+                if name in row:
+                    names.append(name)
+                    break
+            else:
+                raise KeyError(f.full_name)
+        return names
+
+    def pages(self, size: int) -> Iterator[list[tuple]]:
+        """
+        Iterate over result of SQL query by pages, using keyset pagination, see SelectQuery.after.
+
+        All ordering fields should be selected.
+
+        :param size: amount of rows in page.
+        :return: iterator of lists of rows.
+        """
+        if not self._order:
+            raise ValueError('keyset pagination requires ordering fields, use ORDERBY first')
+        indexes = self._order_indexes()
+        page = self.LIMIT(size)
+        while page_rows := page(keep_body=False):
+            yield page_rows
+            if len(page_rows) < size:
+                break
+            last_row = page_rows[-1]
+            page = page.after(values=[last_row[i] for i in indexes])
+
     def UPDATE(self, values: tuple | list) -> 'UpdateQuery':
         """Make new UpdateQuery, that affects rows and fields selected with current SelectQuery."""
         return UpdateQuery(self, values)
@@ -263,29 +458,283 @@ class SelectQuery:
         """-query Make new DeleteQuery, that will delete rows selected with current SelectQuery."""
         return self.DELETE()
 
-    def __call__(self) -> list[tuple]:
+    def __call__(self, keep_body: bool = True, **values) -> list[tuple]:
         """
         Get result of SQL query, which is presented by current object.
 
+        Query with template.Param placeholders is compiled once, and only their values are bound on every call.
+
+        :param keep_body: True means to store result in SelectQuery.body.
+        :param values: values for template.Param placeholders by their names.
         :return: select SQL query result.
         """
-        query = str(self)
-        self._body = self._source.db.query(query, commit=False).fetchall()
+        if (advisor := self._source.db.index_advisor) is not None:
+            advisor.record(self._source, self._where_with_after())
+        query, params = self._bound(values)
+        body = self._source.db.fetch(query, params=params, tables=(t.name for t in self._source.binded),
+                                     kind='SelectQuery')
+        if keep_body:
+            self._body = body
 
-        return self._body
+        return body
 
-    def __str__(self):
+    def stream(self, batch_size: int = 1000, **values) -> Iterator[tuple]:
+        """
+        Lazily iterate over result of SQL query, which is presented by current object.
+
+        Rows are fetched from database in batches, so memory usage does not depend on result size.
+        Result is not stored in SelectQuery.body.
+
+        :param batch_size: amount of rows fetched from database at once.
+        :param values: values for template.Param placeholders by their names.
+        :return: iterator of select SQL query result rows.
+        """
+        if (advisor := self._source.db.index_advisor) is not None:
+            advisor.record(self._source, self._where_with_after())
+        query, params = self._bound(values)
+        return self._source.db.stream(query, params=params, batch_size=batch_size, kind='SelectQuery')
+
+    def to_columns(self, batch_size: int = 10000, **values) -> dict[str, Sequence]:
+        """
+        Get result of SQL query, which is presented by current object, as columns.
+
+        Rows are fetched from database in batches and put to typed column arrays, without making list of all rows.
+        Column type is taken from field declared type: INTEGER becomes int64, REAL becomes float64, TEXT becomes object.
+        NumPy arrays are made if NumPy is installed, otherwise array.array for numbers and list for others.
+
+        :param batch_size: amount of rows fetched from database at once.
+        :param values: values for template.Param placeholders by their names.
+        :return: dict of {field name: column array}. Full field names are used for calculated and repeated fields.
+        """
+        names = self._column_names()
+        columns = [_Columns.Column(_Columns.column_kind(f)) for f in self._fields]
+
+        rows = self.stream(batch_size=batch_size, **values)
+        while batch := list(itertools.islice(rows, batch_size)):
+            for column, values in zip(columns, zip(*batch)):
+                column.extend(values)
+
+        return {name: column.result() for name, column in zip(names, columns)}
+
+    def to_csv(self, path: str, header: bool = True, batch_size: int = 1000, encoding: str = 'utf-8',
+               values: Mapping = None, **fmtparams) -> '_Report.BulkReport':
+        """
+        Write result of SQL query, which is presented by current object, to CSV file.
+
+        Rows are fetched from database in batches and written as they come, so memory usage does not depend on result size.
+        NULL values are written as empty cells.
+
+        :param path: path of CSV file.
+        :param header: True means to write header with field names, named as in SelectQuery.to_columns.
+        :param batch_size: amount of rows fetched from database at once.
+        :param encoding: file encoding.
+        :param values: values for template.Param placeholders by their names.
+        :param fmtparams: csv.writer formatting parameters, f.ex. delimiter.
+        :return: BulkReport with amount of written rows and throughput.
+        """
+        started = time.perf_counter()
+        count = 0
+        with open(path, 'w', newline='', encoding=encoding) as file:
+            writer = csv.writer(file, **fmtparams)
+            if header:
+                writer.writerow(self._column_names())
+            rows = self.stream(batch_size=batch_size, **(values or {}))
+            while batch := list(itertools.islice(rows, batch_size)):
+                writer.writerows(batch)
+                count += len(batch)
+
+        return _Report.BulkReport(count, time.perf_counter() - started)
+
+    def _column_names(self) -> list[str]:
+        """Get names of selected fields: full names for calculated and repeated fields, short names for others."""
+        names = [f.name for f in self._fields]
+        return [f.full_name if (isinstance(f, _Table.CalculatedField) or names.count(f.name) > 1) else f.name
+                for f in self._fields]
+
+    def count(self, **values) -> int:
+        """
+        Get amount of rows selected with current SelectQuery, without fetching them.
+
+        For grouped query it is amount of groups.
+
+        :param values: values for template.Param placeholders by their names.
+        """
+        return self._scalar('COUNT', values=values)
+
+    def exists(self, **values) -> bool:
+        """Check whether current SelectQuery selects any row, without fetching them."""
+        return bool(self._scalar('EXISTS', values=values))
+
+    def sum(self, field: Union[str, '_Table.TableField'] = None, **values) -> int | float | None:
+        """
+        Get sum of field values over rows selected with current SelectQuery, without fetching them.
+
+        :param field: field name or TableField. Can be omitted if only one field is selected.
+        :param values: values for template.Param placeholders by their names.
+        :return: sum of values or None if no rows are selected.
+        """
+        return self._scalar('SUM', field, values)
+
+    def avg(self, field: Union[str, '_Table.TableField'] = None, **values) -> float | None:
+        """Get average of field values over rows selected with current SelectQuery, see SelectQuery.sum."""
+        return self._scalar('AVG', field, values)
+
+    def min(self, field: Union[str, '_Table.TableField'] = None, **values):
+        """Get minimal field value over rows selected with current SelectQuery, see SelectQuery.sum."""
+        return self._scalar('MIN', field, values)
+
+    def max(self, field: Union[str, '_Table.TableField'] = None, **values):
+        """Get maximal field value over rows selected with current SelectQuery, see SelectQuery.sum."""
+        return self._scalar('MAX', field, values)
+
+    def _scalar(self, function: str, field: Union[str, '_Table.TableField'] = None, values: Mapping = None):
+        """
+        Get single value calculated by database over rows selected with current SelectQuery.
+
+        Plain selection is aggregated directly, while DISTINCT, grouped, limited one
+        or one with calculated fields is aggregated as subquery.
+
+        :param function: 'COUNT', 'EXISTS' or aggregate function name.
+        :param field: field to aggregate, not used for COUNT and EXISTS.
+        :param values: values for template.Param placeholders by their names.
+        :return: calculated value.
+        """
+        if (advisor := self._source.db.index_advisor) is not None:
+            advisor.record(self._source, self._where_with_after())
+        nested = (self._distinct or self._group or self._having or (self._limit is not None) or (self._offset is not None)
+                  or any(isinstance(f, _Table.CalculatedField) for f in self._fields))
+        if function in ('COUNT', 'EXISTS'):
+            field = None
+        elif nested:
+            selected = self._scalar_field(field)
+            if (field := self._selected_index(selected)) is None:
+                raise ValueError(f'field {selected.full_name} to aggregate is not selected')
+        else:
+            field = self._scalar_field(field)
+
+        _, params = self._bound(values or {})
+        key = ('scalar', function, field.shape if isinstance(field, _Table.TableField) else field, self.shape)
+        cache = self._source.db.sql_cache
+        query = cache.get(key)
+        if query is None:
+            query = self._render_scalar(function, field, nested)
+            cache.put(key, query)
+
+        rows = self._source.db.fetch(query, params=params, tables=(t.name for t in self._source.binded),
+                                     kind='SelectQuery')
+        return rows[0][0]
+
+    def _scalar_field(self, field: Union[str, '_Table.TableField'] | None) -> '_Table.TableField':
+        """Get field to aggregate by its name, or the only selected one."""
+        if field is None:
+            if len(self._fields) != 1:
+                raise ValueError(f'field to aggregate is required, {len(self._fields)} fields are selected')
+            return self._fields[0]
+        if isinstance(field, str):
+            return self._source.field_by_name(field)
+        return field
+
+    def _render_scalar(self, function: str, field: Union[int, '_Table.TableField'] | None, nested: bool) -> str:
+        """
+        Render SQL text of scalar query.
+
+        :param field: TableField for plain selection, index of selected field for nested one.
+        """
+        where_condition = self._where_with_after()
+        where, _ = where_condition.compile() if where_condition else (None, tuple())
+        if nested:
+            having, _ = self._having.compile() if self._having else (None, tuple())
+            columns = None if field is None else ",".join(f'{f.full_name} AS c{i}' for i, f in enumerate(self._fields))
+            inner = self._render(where, having, columns=columns).rstrip(';')
+            if function == 'EXISTS':
+                return f'SELECT EXISTS({inner});'
+            return f'SELECT {function}({"*" if field is None else f"c{field}"}) FROM ({inner});'
+
+        where = f' WHERE {where}' if where else ""
+        if function == 'EXISTS':
+            return f'SELECT EXISTS(SELECT 1 FROM {self.source.query}{where} LIMIT 1);'
+        return f'SELECT {function}({"*" if field is None else field.full_name}) FROM {self.source.query}{where};'
+
+    def explain(self, **values) -> '_Profiling.QueryPlan':
+        """
+        Get query plan of SQL query, which is presented by current object.
+
+        Use it to find out whether tables are fully scanned (QueryPlan.scans) or searched by index (QueryPlan.searches).
+
+        :param values: values for template.Param placeholders by their names.
+        :return: parsed result of EXPLAIN QUERY PLAN.
+        """
+        query, params = self._bound(values)
+        return self._source.db.explain(query, params)
+
+    def __iter__(self) -> Iterator[tuple]:
+        """Lazily iterate over result of SQL query, see SelectQuery.stream."""
+        return self.stream()
+
+    def compile(self) -> tuple[str, tuple]:
+        """
+        Compile current object to SQL text with '?' placeholders.
+
+        Queries of the same shape compile to the same SQL text, so database can reuse prepared statement.
+        SQL texts are cached in DBase.sql_cache by query shape, so only parameters are collected for known shapes.
+
+        :return: (SQL text, tuple of parameters to bind).
+        """
+        if self._compiled is not None:
+            return self._compiled
+
+        cache = self._source.db.sql_cache
+        query = cache.get(self.shape)
+        where_condition = self._where_with_after()
+        if query is None:
+            where, where_params = where_condition.compile() if where_condition else (None, tuple())
+            having, having_params = self._having.compile() if self._having else (None, tuple())
+            query = self._render(where, having)
+            cache.put(self.shape, query)
+        else:
+            where_params = where_condition.params() if where_condition else tuple()
+            having_params = self._having.params() if self._having else tuple()
+
+        limit_params = tuple(v for v in (self._limit, self._offset) if v is not None)
+        self._compiled = query, where_params + having_params + limit_params
+        self._is_template = template.has_params(self._compiled[1])
+        return self._compiled
+
+    def _bound(self, values: Mapping) -> tuple[str, tuple]:
+        """Compile current object and bind values to its template.Param placeholders."""
+        query, params = self.compile()
+        if self._is_template:
+            params = template.bind(params, values)
+        return query, params
+
+    def _where_with_after(self) -> '_Where.Where | None':
+        """Get WHERE condition together with keyset pagination condition."""
+        if self._after is None:
+            return self._where
+        if self._where is None:
+            return self._after
+        return _Where.WhereAND(self._where, self._after)
+
+    def _render(self, where: str | None, having: str | None, limit: str = '?', offset: str = '?',
+                columns: str = None) -> str:
         select = f'''SELECT {"DISTINCT" if self._distinct else ""}
-        {",".join(f.full_name for f in self.fields)} 
+        {columns or ",".join(f.full_name for f in self.fields)} 
         FROM {self.source.query}'''
-        where = f' WHERE {self._where}' if self._where else ""
+        where = f' WHERE {where}' if where else ""
         group = f' GROUP BY {",".join(f.full_name for f in self._group)}' if self._group else ""
         order = f' ORDER BY {",".join(f.full_name for f in self._order)}' if self._order else ""
-        having = f' HAVING {self._having}' if self._having else ""
+        having = f' HAVING {having}' if having else ""
+        limit = f' LIMIT {limit}' if self._limit is not None else ""
+        offset = f' OFFSET {offset}' if self._offset is not None else ""
 
-        query = f'{select}{where}{group}{having}{order};'
+        query = f'{select}{where}{group}{having}{order}{limit}{offset};'
         return query
 
+    def __str__(self):
+        where = self._where_with_after()
+        return self._render(str(where) if where else None, str(self._having) if self._having else None,
+                            limit=str(self._limit), offset=str(self._offset))
+
     def __repr__(self) -> str:
         return str(self)
 
@@ -296,6 +745,9 @@ class SelectQuery:
         new._having = self._having
         new._group = self._group
         new._order = self._order
+        new._after = self._after
+        new._limit = self._limit
+        new._offset = self._offset
         new._union_comparator = self._union_comparator
 
         return new
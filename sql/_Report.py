@@ -0,0 +1,15 @@
+class BulkReport:
+    """
+    BulkReport object describes result of bulk operation on DBase.
+    """
+    def __init__(self, rows: int, seconds: float):
+        self.rows = rows
+        self.seconds = seconds
+
+    @property
+    def rows_per_second(self) -> float:
+        """Operation throughput."""
+        return self.rows / self.seconds if self.seconds > 0 else float(self.rows)
+
+    def __repr__(self) -> str:
+        return f'BulkReport<{self.rows} rows in {self.seconds:.3f}s, {self.rows_per_second:.0f} rows/s>'
@@ -0,0 +1,111 @@
+import threading
+
+from . import _Base
+from . import _Table
+
+
+class SchemaCatalog:
+    """
+    SchemaCatalog object keeps schema metadata of all tables in DBase.
+
+    Table info and foreign key lists of all tables are loaded from database with single pass on first access
+    and kept until schema is changed through DBase. TableField and TableFK objects made from them are cached as well.
+    """
+    def __init__(self, db: '_Base.DBase'):
+        self._db = db
+        self._lock = threading.Lock()
+        self._table_info: dict[str, list[tuple]] | None = None
+        self._foreign_key_list: dict[str, list[tuple]] | None = None
+        self._index_list: dict[str, list[tuple]] | None = None
+        self.fields: dict[str, dict[str, '_Table.TableField']] = dict()
+        self.foreign_keys: dict[str, dict[str, '_Table.TableFK']] = dict()
+
+    def load(self) -> None:
+        """Load table info and foreign key lists of all tables from database."""
+        info = self._db.query('''SELECT m.name, p.* FROM sqlite_master AS m
+        JOIN pragma_table_info(m.name) AS p WHERE m.type = 'table' ORDER BY m.name, p.cid''').fetchall()
+        fks = self._db.query('''SELECT m.name, f.* FROM sqlite_master AS m
+        JOIN pragma_foreign_key_list(m.name) AS f WHERE m.type = 'table' ORDER BY m.name, f.id, f.seq''').fetchall()
+
+        table_info = dict()
+        for table_name, *row in info:
+            table_info.setdefault(table_name, []).append(tuple(row))
+        foreign_key_list = dict()
+        for table_name, *row in fks:
+            foreign_key_list.setdefault(table_name, []).append(tuple(row))
+
+        with self._lock:
+            self._table_info = table_info
+            self._foreign_key_list = foreign_key_list
+
+    def table_info(self, table_name: str) -> list[tuple]:
+        """
+        Get rows of 'PRAGMA table_info' for table.
+
+        :param table_name: table string name as it is in base.
+        """
+        if self._table_info is None:
+            self.load()
+        return self._table_info.get(table_name, [])
+
+    def foreign_key_list(self, table_name: str) -> list[tuple]:
+        """
+        Get rows of 'PRAGMA foreign_key_list' for table.
+
+        :param table_name: table string name as it is in base.
+        """
+        if self._foreign_key_list is None:
+            self.load()
+        return self._foreign_key_list.get(table_name, [])
+
+    def load_indexes(self) -> None:
+        """Load indexes of all tables from database."""
+        rows = self._db.query('''SELECT m.name, il.name, il."unique", il.origin, ii.name FROM sqlite_master AS m
+        JOIN pragma_index_list(m.name) AS il JOIN pragma_index_info(il.name) AS ii
+        WHERE m.type = 'table' ORDER BY m.name, il.name, ii.seqno''').fetchall()
+
+        index_list = dict()
+        for table_name, *row in rows:
+            index_list.setdefault(table_name, []).append(tuple(row))
+
+        with self._lock:
+            self._index_list = index_list
+
+    def index_list(self, table_name: str) -> list[tuple]:
+        """
+        Get indexed columns of table: (index name, is unique, origin, column name) rows ordered by index and column position.
+        Column name is None for indexed expression.
+
+        :param table_name: table string name as it is in base.
+        """
+        if self._index_list is None:
+            self.load_indexes()
+        return self._index_list.get(table_name, [])
+
+    def invalidate_indexes(self) -> None:
+        """Forget loaded indexes after index is created or dropped."""
+        with self._lock:
+            self._index_list = None
+
+    def invalidate(self, table_name: str = None) -> None:
+        """
+        Forget loaded metadata after schema change.
+
+        :param table_name: changed table string name. None means that whole schema is changed.
+        """
+        with self._lock:
+            self._table_info = None
+            self._foreign_key_list = None
+            self._index_list = None
+            if table_name is None:
+                self.fields.clear()
+                self.foreign_keys.clear()
+                return
+
+            self.fields.pop(table_name, None)
+            for slave_name, keys in tuple(self.foreign_keys.items()):
+                if (slave_name == table_name) or any(fk.master_field.table.name == table_name for fk in keys.values()):
+                    self.foreign_keys.pop(slave_name, None)
+
+    def __repr__(self) -> str:
+        return f'SchemaCatalog<{self._db.name}, {len(self.fields)} tables cached>'
@@ -1,6 +1,11 @@
-from typing import Iterable, Union, Mapping, Any, Sequence
+import csv
+from typing import Iterable, Iterator, Union, Mapping, Any, Sequence
 from . import _Base
 from . import _Query
+from . import _Report
+from . import _Columns
+from . import _Csv
+from . import _exceptions
 from . import _FieldConstraints as _Constr
 from . import aggregate
 
@@ -21,8 +26,13 @@ class Table:
 
         self._fields = dict()
         self._foreign_keys = dict()
+        self._names: dict[str, str] = dict()
+        self._ambiguous: dict[str, list[str]] = dict()
+        self._join_fields: tuple['TableField', ...] = tuple()
         for rqt in self.binded:
-            self._fields.update(db_obj.table_fields(rqt))
+            rqt_fields = db_obj.table_fields(rqt)
+            self._fields.update(rqt_fields)
+            self._index_fields(rqt_fields)
             self._foreign_keys.update(db_obj.table_foreign_keys(rqt))
 
         self._foreign_tables = set()
@@ -32,6 +42,18 @@ class Table:
         for field in self.fields.values():
             self.__dict__.update({f'f_{field.name}': field})
 
+    def _index_fields(self, fields: Mapping[str, 'TableField']) -> None:
+        """Add fields to index of field names and full names, detecting ambiguous field names."""
+        for full_name, field in fields.items():
+            self._names[full_name] = full_name
+            if field.name in self._ambiguous:
+                self._ambiguous[field.name].append(full_name)
+            elif (known := self._names.get(field.name, full_name)) != full_name:
+                self._ambiguous[field.name] = [known, full_name]
+                del self._names[field.name]
+            else:
+                self._names[field.name] = full_name
+
     def field_by_name(self, field_name: str) -> 'TableField':
         """
         Get TableField reference by field_name from this Table.
@@ -46,15 +68,19 @@ class Table:
         Copmile <Table_Name>.<Field_Name> from only Field_Name for one of this Table's real binded Tabled.
 
         If field is not present in Table, raise KeyError.
+        If field is present in several binded Tables, raise FieldIsAmbiguous (which is KeyError too).
 
         :param field_name: field name.
         :return: field name with this Table's name reference
         """
+        try:
+            return self._names[field_name]
+        except KeyError:
+            pass
+        if field_name in self._ambiguous:
+            raise _exceptions.FieldIsAmbiguous(field_name, self.name, self._ambiguous[field_name])
         if "." in field_name:
             return field_name
-        for try_table in self.binded:
-            if self.has_field(fname := f'{try_table.name}.{field_name}'):
-                return fname
         raise KeyError(f"{self} has no field {field_name}")
 
     def has_field(self, field_name: str) -> bool:
@@ -64,13 +90,7 @@ class Table:
         :param field_name: field name with (or without) real Table name reference.
         :return: This Table contains field
         """
-        if "." in field_name:
-            return field_name in self.fields
-        else:
-            for try_table in self.binded:
-                if (fname := f'{try_table.name}.{field_name}') in self.fields:
-                    return True
-        return False
+        return (field_name in self._names) or (field_name in self._ambiguous)
 
     def has_fields(self, field_names: Iterable[str]) -> bool:
         """
@@ -140,6 +160,16 @@ class Table:
         """All Tables to whom current Table is connected by foreign keys."""
         return self._foreign_tables.copy()
 
+    @property
+    def indexes(self) -> dict[str, 'TableIndex']:
+        """All indexes of current Table."""
+        return self._db.table_indexes(self)
+
+    @property
+    def join_fields(self) -> tuple['TableField', ...]:
+        """Fields used in JOIN comparisons of current Table composition."""
+        return self._join_fields
+
     def catch_fk_connection(self, other: 'Table') -> 'TableFK':
         """
         Find Foreign Key that connects two tables.
@@ -170,12 +200,17 @@ class Table:
         :param other_field: field of other Table to use in JOIN comparison
         :return:
         """
-        name = f"{self.name}_{join}_{other.name}"
+        def make() -> 'Table':
+            name = f"{self.name}_{join}_{other.name}"
 
-        binded = self.binded.union(other.binded)
-        query = f'{self.query} {join} JOIN {other.query} ON {self_field.full_name} = {other_field.full_name}'
+            binded = self.binded.union(other.binded)
+            query = f'{self.query} {join} JOIN {other.query} ON {self_field.full_name} = {other_field.full_name}'
 
-        return Table(name, self.db, table_query=f'({query})', binded_tables=binded)
+            table = Table(name, self.db, table_query=f'({query})', binded_tables=binded)
+            table._join_fields = self.join_fields + other.join_fields + (self_field, other_field)
+            return table
+
+        return self.db.composite(('JOIN', join, self, other, self_field, other_field), make)
 
     def DROP(self) -> None:
         """
@@ -183,6 +218,37 @@ class Table:
         """
         self._db.drop(self.name)
 
+    def CREATE_INDEX(self, field_names: tuple | str, unique=False, index_name: str = None) -> 'TableIndex':
+        """
+        Create index on this Table's fields.
+
+        Only Real Tables supported.
+
+        :param field_names: field name or tuple of field names to index.
+        :param unique: True means to create UNIQUE index.
+        :param index_name: name for new index. By default, it is made from table and field names.
+        :return: TableIndex of new index.
+        """
+        if not self.is_real:
+            raise _exceptions.TableIsNotReal(self.name)
+        if not isinstance(field_names, tuple):
+            field_names = (field_names,)
+
+        fields = tuple(self.field_by_name(f).name for f in field_names)
+        index_name = self._db.create_index(self.name, fields, unique=unique, index_name=index_name)
+        return self.indexes[index_name]
+
+    def DROP_INDEX(self, index: Union[str, 'TableIndex']) -> None:
+        """
+        Drop index of this Table.
+
+        :param index: index name or TableIndex object.
+        """
+        index_name = index if isinstance(index, str) else index.name
+        if index_name not in self.indexes:
+            raise KeyError(f'{self} has no index {index_name}')
+        self._db.drop_index(index_name)
+
     def INSERT(self, values: Mapping[str, Any] | Sequence):
         """
         Insert new row into this Table with specified values.
@@ -216,6 +282,110 @@ class Table:
 
         self.db.insert(self.name, fields, values)
 
+    def INSERT_MANY(self, rows: Iterable[Mapping[str, Any] | Sequence], chunk_size: int = 1000) -> '_Report.BulkReport':
+        """
+        Insert many rows into this Table within single transaction.
+
+        Rows follow the same rules as for Table.INSERT, but are streamed to DBase in chunks.
+        Only Real Tables supported.
+
+        :param rows: Iterable of <tuple | dict> definitions for new rows.
+        :param chunk_size: amount of rows passed to DBase at once.
+        :return: BulkReport with amount of inserted rows and throughput.
+        """
+        if not self.is_real:
+            raise TypeError(f'Only Real Tables supported. {self} is a query composition of {self.binded} tables')
+
+        fields = tuple(field.name for field in self._fields.values())
+        return self.db.insert_many(self.name, fields, self._checked_rows(rows), chunk_size=chunk_size)
+
+    def UPDATE_MANY(self, key_field: str | tuple[str, ...], rows: Iterable[Mapping[str, Any] | Sequence],
+                    chunk_size: int = 1000) -> '_Report.BulkReport':
+        """
+        Update many rows of this Table with different values within single transaction.
+
+        Every row is found by value of key_field, and the rest of its fields are set to given values, NULL included.
+        Only Real Tables supported.
+
+        :param key_field: name of field to find rows by, f.ex. primary key, or tuple of names.
+        :param rows: Iterable of <tuple | dict> rows with key field values. Tuples should contain all Table fields.
+        :param chunk_size: amount of rows passed to DBase at once.
+        :return: BulkReport with amount of updated rows and throughput.
+        """
+        if not self.is_real:
+            raise TypeError(f'Only Real Tables supported. {self} is a query composition of {self.binded} tables')
+
+        keys = (key_field,) if isinstance(key_field, str) else tuple(key_field)
+        keys = tuple(self._fields[self.field_from_name(k)].name for k in keys)
+        fields = tuple(field.name for field in self._fields.values())
+        return self.db.update_many(self.name, keys, fields, self._checked_rows(rows), chunk_size=chunk_size)
+
+    def UPSERT(self, rows: Iterable[Mapping[str, Any] | Sequence], conflict_fields: str | tuple[str, ...],
+               chunk_size: int = 1000) -> '_Report.BulkReport':
+        """
+        Insert many rows into this Table, or update existing ones, within single transaction.
+
+        If row with the same values of conflict_fields exists, its other fields are set to given values, NULL included.
+        Conflict fields should have UNIQUE index or be primary key.
+        Only Real Tables supported.
+
+        :param rows: Iterable of <tuple | dict> rows with conflict fields values. Tuples should contain all Table fields.
+        :param conflict_fields: name of unique field or tuple of names.
+        :param chunk_size: amount of rows passed to DBase at once.
+        :return: BulkReport with amount of inserted or updated rows and throughput.
+        """
+        if not self.is_real:
+            raise TypeError(f'Only Real Tables supported. {self} is a query composition of {self.binded} tables')
+
+        keys = (conflict_fields,) if isinstance(conflict_fields, str) else tuple(conflict_fields)
+        keys = tuple(self._fields[self.field_from_name(k)].name for k in keys)
+        fields = tuple(field.name for field in self._fields.values())
+        return self.db.upsert(self.name, keys, fields, self._checked_rows(rows), chunk_size=chunk_size)
+
+    def load_csv(self, path: str, fields: Sequence[str] = None, header: bool = True, chunk_size: int = 1000,
+                 processes: int = None, encoding: str = 'utf-8', **fmtparams) -> '_Report.BulkReport':
+        """
+        Insert rows from CSV file into this Table within single transaction.
+
+        File is read lazily and rows are inserted in chunks, so memory usage does not depend on file size.
+        Cells are converted by field type: INTEGER and REAL cells become numbers, and empty ones become NULL.
+        Only Real Tables supported.
+
+        :param path: path of CSV file.
+        :param fields: names of fields in order of CSV columns. By default, names from header or all Table fields.
+        :param header: True means that the first CSV row is a header with field names.
+        :param chunk_size: amount of rows converted and passed to DBase at once.
+        :param processes: amount of processes to convert rows. It pays off only for expensive conversion,
+        as rows are passed between processes. None means to convert in current process.
+        :param encoding: file encoding.
+        :param fmtparams: csv.reader formatting parameters, f.ex. delimiter.
+        :return: BulkReport with amount of inserted rows and throughput.
+        """
+        if not self.is_real:
+            raise TypeError(f'Only Real Tables supported. {self} is a query composition of {self.binded} tables')
+
+        with open(path, newline='', encoding=encoding) as file:
+            reader = csv.reader(file, **fmtparams)
+            names = next(reader, []) if header else None
+            fields = fields if fields is not None else names
+            fields = tuple(self._fields[self.field_from_name(f)] for f in fields) if fields is not None \
+                else tuple(self._fields.values())
+
+            rows = _Csv.coerced(reader, [_Columns.column_kind(f) for f in fields], chunk_size, processes=processes)
+            return self.db.insert_many(self.name, tuple(f.name for f in fields), rows,
+                                       chunk_size=chunk_size, drop_nulls=False)
+
+    def _checked_rows(self, rows: Iterable[Mapping[str, Any] | Sequence]) -> Iterator[Mapping[str, Any] | Sequence]:
+        """Check that rows are <tuple> or <dict> with this Table fields only, lazily."""
+        names = set(field.name for field in self._fields.values())
+        for row in rows:
+            if isinstance(row, dict):
+                if not names.issuperset(row):
+                    raise KeyError(f'Table {self} does not have fields {set(row).difference(names)}')
+            elif not isinstance(row, tuple):
+                raise TypeError(f'expected <tuple> or <dict>, got {type(row)}')
+            yield row
+
     def SELECT(self, field_names: Union[slice, tuple, str, 'aggregate.Aggregate']) -> '_Query.SelectQuery':
         """
         Create SelectQuery for Table.
@@ -224,7 +394,7 @@ class Table:
         :return: new SelectQuery
         """
         if isinstance(field_names, slice):
-            field_names = tuple(self.fields.keys())
+            field_names = tuple(self._fields.keys())
         if not isinstance(field_names, tuple):
             field_names = (field_names,)
 
@@ -244,11 +414,16 @@ class Table:
         :param other: other Table for production
         :return: new Table with is_real=False property
         """
-        name = f'{self.name}_x_{other.name}'
-        binded = self.binded.union(other.binded)
-        query = f'({self.query} CROSS JOIN {other._query})'
+        def make() -> 'Table':
+            name = f'{self.name}_x_{other.name}'
+            binded = self.binded.union(other.binded)
+            query = f'({self.query} CROSS JOIN {other._query})'
+
+            table = Table(name, self._db, table_query=query, binded_tables=binded)
+            table._join_fields = self.join_fields + other.join_fields
+            return table
 
-        return Table(name, self._db, table_query=query, binded_tables=binded)
+        return self._db.composite(('AND', self, other), make)
 
     def INNER(self, other: 'Table') -> 'Table':
         """
@@ -257,15 +432,15 @@ class Table:
         :param other: other Table to join
         :return: new Table with is_real=False property
         """
-        fk_connection = self.catch_fk_connection(other)
+        def make() -> 'Table':
+            fk_connection = self.catch_fk_connection(other)
 
-        master = fk_connection.master_field.table
-        slave = fk_connection.slave_field.table
+            master_ref = fk_connection.master_field
+            slave_ref = fk_connection.slave_field
 
-        master_ref = fk_connection.master_field
-        slave_ref = fk_connection.slave_field
+            return self.join(other, 'INNER', master_ref, slave_ref)
 
-        return self.join(other, 'INNER', master_ref, slave_ref)
+        return self._db.composite(('INNER', self, other), make)
 
     def LEFT(self, other: 'Table') -> 'Table':
         """
@@ -276,16 +451,19 @@ class Table:
         :param other: other Table to exclude from this Table.
         :return:new Table with is_real=False property
         """
-        fk_connection = self.catch_fk_connection(other)
+        def make() -> 'Table':
+            fk_connection = self.catch_fk_connection(other)
 
-        if fk_connection.master_field.table == self:
-            self_ref = fk_connection.master_field
-            other_ref = fk_connection.slave_field
-        else:
-            self_ref = fk_connection.slave_field
-            other_ref = fk_connection.master_field
+            if fk_connection.master_field.table == self:
+                self_ref = fk_connection.master_field
+                other_ref = fk_connection.slave_field
+            else:
+                self_ref = fk_connection.slave_field
+                other_ref = fk_connection.master_field
+
+            return self.join(other, 'LEFT', self_ref, other_ref)
 
-        return self.join(other, 'LEFT', self_ref, other_ref)
+        return self._db.composite(('LEFT', self, other), make)
 
     def FULL(self, other: 'Table') -> 'Table':
         """
@@ -294,14 +472,15 @@ class Table:
         :param other: other Tabl to join.
         :return: new Table with is_real=False property
         """
-        fk_connection = self.catch_fk_connection(other)
-        master = fk_connection.master_field.table
-        slave = fk_connection.slave_field.table
+        def make() -> 'Table':
+            fk_connection = self.catch_fk_connection(other)
 
-        master_ref = fk_connection.master_field
-        slave_ref = fk_connection.slave_field
+            master_ref = fk_connection.master_field
+            slave_ref = fk_connection.slave_field
 
-        return self.join(other, 'FULL', master_ref, slave_ref)
+            return self.join(other, 'FULL', master_ref, slave_ref)
+
+        return self._db.composite(('FULL', self, other), make)
 
     def __getitem__(self, field_names: Union[slice, tuple, str, 'aggregate.Aggregate']) -> '_Query.SelectQuery':
         """
@@ -393,6 +572,11 @@ class TableField:
         """Full name means <Table name>.<Field name>"""
         return self.table.field_from_name(self.name)
 
+    @property
+    def shape(self) -> tuple[str, str, str]:
+        """Hashable key of field used in query shapes."""
+        return 'field', self.table.name, self.name
+
     @property
     def is_primary(self) -> bool:
         for c in self.constraints:
@@ -440,6 +624,11 @@ class CalculatedField:
     def full_name(self) -> str:
         return f'{self.function}({self.field.full_name})'
 
+    @property
+    def shape(self) -> tuple[str, str, str, str]:
+        """Hashable key of field used in query shapes."""
+        return self.function, *self.field.shape
+
     @property
     def id(self) -> int:
         return self.field.id
@@ -493,4 +682,45 @@ class TableFK:
         return (self.master_field == other.master_field) and (self.slave_field == other.slave_field)
 
     def __hash__(self):
-        return hash((self.master_field, self.slave_field))
\ No newline at end of file
+        return hash((self.master_field, self.slave_field))
+
+
+class TableIndex:
+    """TableIndex object represents index on TableFields."""
+    def __init__(self, name: str, fields: Iterable[TableField], unique: bool = False, origin: str = "c"):
+        self._name = name
+        self._fields = tuple(fields)
+        self._unique = unique
+        self._origin = origin
+
+    @property
+    def name(self) -> str:
+        """Index name as it is in database."""
+        return self._name
+
+    @property
+    def fields(self) -> tuple['TableField', ...]:
+        """Indexed fields in index order."""
+        return self._fields
+
+    @property
+    def is_unique(self) -> bool:
+        return self._unique
+
+    @property
+    def is_auto(self) -> bool:
+        """Is index made by database for PRIMARY KEY or UNIQUE constraint, not with CREATE INDEX."""
+        return self._origin != "c"
+
+    def covers(self, field: 'TableField') -> bool:
+        """Can index be used to search by field, i.e. field is first indexed field."""
+        return bool(self._fields) and (self._fields[0] == field)
+
+    def __repr__(self) -> str:
+        return f'TableIndex<{self.name}{" UNIQUE" if self.is_unique else ""} on {", ".join(f.full_name for f in self.fields)}>'
+
+    def __eq__(self, other: 'TableIndex'):
+        return (self.name == other.name) and (self.fields == other.fields)
+
+    def __hash__(self):
+        return hash((self.name, self.fields))
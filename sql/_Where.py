@@ -1,6 +1,10 @@
-from typing import Union
+import json
+import math
+from typing import Union, Sequence
 
 from . import _Table
+from . import _Columns
+from . import _internal
 
 
 class Where:
@@ -11,14 +15,62 @@ class Where:
         self._left = field1
         self._right = field2
 
-        if isinstance(self._left, Union[_Table.TableField, _Table.CalculatedField]):
-            self._left = self._left.full_name
+    @staticmethod
+    def _compile_operand(operand) -> tuple[str, tuple]:
+        """Compile condition operand to SQL text and its bound parameters."""
+        if isinstance(operand, Union[_Table.TableField, _Table.CalculatedField]):
+            return operand.full_name, ()
+        return '?', (operand,)
 
-        if isinstance(self._right, Union[_Table.TableField, _Table.CalculatedField]):
-            self._right = self._right.full_name
+    @staticmethod
+    def _operand_shape(operand) -> tuple | str:
+        """Get hashable shape of condition operand: field shape or placeholder for value."""
+        if isinstance(operand, Union[_Table.TableField, _Table.CalculatedField]):
+            return operand.shape
+        return '?'
+
+    @staticmethod
+    def _operand_params(operand) -> tuple:
+        """Get bound parameters of condition operand."""
+        if isinstance(operand, Union[_Table.TableField, _Table.CalculatedField]):
+            return tuple()
+        return operand,
+
+    @staticmethod
+    def _render_operand(operand) -> str:
+        """Render condition operand as SQL text with inlined value."""
+        if isinstance(operand, Union[_Table.TableField, _Table.CalculatedField]):
+            return operand.full_name
+        return _internal.proper_values((operand,))[0]
+
+    def compile(self) -> tuple[str, tuple]:
+        """
+        Compile condition to SQL text with '?' placeholders.
+
+        :return: (SQL text, tuple of parameters to bind).
+        """
+        left, left_params = self._compile_operand(self._left)
+        right, right_params = self._compile_operand(self._right)
+        return f'({left} {self.__class__._operator} {right})', left_params + right_params
+
+    def shape(self) -> tuple:
+        """
+        Get hashable shape of condition.
+
+        Conditions of the same shape compile to the same SQL text and differ only in bound parameters.
+        """
+        return self.__class__._operator, self._operand_shape(self._left), self._operand_shape(self._right)
+
+    def params(self) -> tuple:
+        """Get parameters to bind for compiled condition without compiling it."""
+        return self._operand_params(self._left) + self._operand_params(self._right)
+
+    def fields(self) -> tuple['_Table.TableField', ...]:
+        """Get Table fields (not calculated ones) compared in condition."""
+        return tuple(o for o in (self._left, self._right) if isinstance(o, _Table.TableField))
 
     def __str__(self) -> str:
-        return f'({self._left} {self.__class__._operator} {self._right})'
+        return f'({self._render_operand(self._left)} {self.__class__._operator} {self._render_operand(self._right)})'
 
 
 class WhereEq(Where):
@@ -36,6 +88,137 @@ class WhereLt(Where):
     _operator = "<"
 
 
+class WhereIn(Where):
+    """
+    Selection condition on equality to any of values: field IN (?, ?, ...)
+
+    Up to inline_limit values are bound as separate parameters. Amount of placeholders is rounded up to power of two,
+    padding with the last value, so sets of different sizes share a few query shapes.
+    Bigger sets of numbers and strings are bound as single JSON array parameter: field IN (SELECT value FROM json_each(?)),
+    so they neither hit SQLite variables limit nor make huge SQL text.
+    Values from JSON array get no type affinity of field, so JSON array is used only when values already have
+    the type field converts them to: numbers for INTEGER and REAL fields, strings for TEXT ones.
+    Other values (f.ex. bytes, None or template.Param) are always inline: above inline_limit amount of placeholders
+    is rounded up to multiple of inline_limit, but never beyond max_variables, and bigger sets are refused.
+    """
+    _operator = "IN"
+    inline_limit = 256
+    max_variables = 32766
+
+    def __init__(self, field: Union['_Table.TableField', '_Table.CalculatedField'], values: Sequence):
+        self._left = field
+        self._right = tuple(values)
+        self._inline = (len(self._right) <= self.inline_limit) or not self._is_json_compatible()
+        if self._inline and (len(self._right) > self.max_variables):
+            raise ValueError(f'IN condition on {len(self._right)} values exceeds SQLite limit of {self.max_variables} '
+                             f'variables, only sets of numbers and strings can be bigger')
+
+    @property
+    def values(self) -> tuple:
+        return self._right
+
+    @property
+    def is_inline(self) -> bool:
+        """Are values bound as separate parameters or as single JSON array."""
+        return self._inline
+
+    def _is_json_compatible(self) -> bool:
+        """Do values compare with field the same way, when they are read from JSON array and bound inline."""
+        if not all(self._is_json(v) for v in self._right):
+            return False
+        if not isinstance(self._left, _Table.TableField):
+            return True
+        kind = _Columns.column_kind(self._left)
+        if kind != 'object':
+            return all(type(v) is not str for v in self._right)
+        if any(t in (self._left.type or "").upper() for t in ('CHAR', 'CLOB', 'TEXT')):
+            return all(type(v) is str for v in self._right)
+        return True
+
+    @staticmethod
+    def _is_json(value) -> bool:
+        """Can value be passed in JSON array and read back with the same type and value."""
+        return (type(value) in (int, str)) or ((type(value) is float) and math.isfinite(value))
+
+    def _size(self) -> int:
+        """Amount of placeholders for inline values."""
+        size = len(self._right)
+        if size <= self.inline_limit:
+            return 1 << (size - 1).bit_length() if size else 0
+        return min(-(-size // self.inline_limit) * self.inline_limit, self.max_variables)
+
+    def compile(self) -> tuple[str, tuple]:
+        left, _ = self._compile_operand(self._left)
+        if self.is_inline:
+            right = f'({", ".join("?" * self._size())})'
+        else:
+            right = '(SELECT value FROM json_each(?))'
+        return f'({left} {self.__class__._operator} {right})', self.params()
+
+    def shape(self) -> tuple:
+        return self.__class__._operator, self._operand_shape(self._left), self._size() if self.is_inline else 'json'
+
+    def params(self) -> tuple:
+        left_params = self._operand_params(self._left)
+        if not self.is_inline:
+            return left_params + (json.dumps(self._right),)
+        return left_params + self._right + self._right[-1:] * (self._size() - len(self._right))
+
+    def fields(self) -> tuple['_Table.TableField', ...]:
+        return (self._left,) if isinstance(self._left, _Table.TableField) else tuple()
+
+    def __str__(self) -> str:
+        return (f'({self._render_operand(self._left)} {self.__class__._operator} '
+                f'({", ".join(self._render_operand(v) for v in self._right)}))')
+
+
+class WhereRowGt(Where):
+    """
+    Selection condition on row value greater (a, b) > (x, y).
+
+    Used for keyset pagination: it selects rows going after given one in order of fields,
+    and may be satisfied with index search on these fields.
+    """
+    _operator = ">"
+
+    def __init__(self, fields: Sequence['_Table.TableField'], values: Sequence):
+        if len(fields) != len(values):
+            raise ValueError(f'expected {len(fields)} values for row comparison, got {len(values)}')
+        self._left = tuple(fields)
+        self._right = tuple(values)
+
+    @staticmethod
+    def _row(operands: Sequence[str]) -> str:
+        return operands[0] if len(operands) == 1 else f'({", ".join(operands)})'
+
+    def compile(self) -> tuple[str, tuple]:
+        params = []
+        right = []
+        for value in self._right:
+            operand, operand_params = self._compile_operand(value)
+            right.append(operand)
+            params.extend(operand_params)
+        left = self._row([f.full_name for f in self._left])
+        return f'({left} {self.__class__._operator} {self._row(right)})', tuple(params)
+
+    def shape(self) -> tuple:
+        return (self.__class__._operator, tuple(f.shape for f in self._left),
+                tuple(self._operand_shape(v) for v in self._right))
+
+    def params(self) -> tuple:
+        params = []
+        for value in self._right:
+            params.extend(self._operand_params(value))
+        return tuple(params)
+
+    def fields(self) -> tuple['_Table.TableField', ...]:
+        return tuple(f for f in self._left if isinstance(f, _Table.TableField))
+
+    def __str__(self) -> str:
+        left = self._row([f.full_name for f in self._left])
+        return f'({left} {self.__class__._operator} {self._row([self._render_operand(v) for v in self._right])})'
+
+
 class WhereComposition(Where):
     """WhereComposition base class for compositions os Where objects."""
     _operator = "????"
@@ -43,6 +226,30 @@ class WhereComposition(Where):
     def __init__(self, *wheres: Union[Where, 'WhereComposition']):
         self._wheres = wheres
 
+    def compile(self) -> tuple[str, tuple]:
+        parts = []
+        params = []
+        for w in self._wheres:
+            part, part_params = w.compile()
+            parts.append(part)
+            params.extend(part_params)
+        return f'({f" {self.__class__._operator} ".join(parts)})', tuple(params)
+
+    def shape(self) -> tuple:
+        return self.__class__._operator, tuple(w.shape() for w in self._wheres)
+
+    def params(self) -> tuple:
+        params = []
+        for w in self._wheres:
+            params.extend(w.params())
+        return tuple(params)
+
+    def fields(self) -> tuple['_Table.TableField', ...]:
+        fields = []
+        for w in self._wheres:
+            fields.extend(w.fields())
+        return tuple(fields)
+
     def __str__(self) -> str:
         return f'({f" {self.__class__._operator} ".join(str(w) for w in self._wheres)})'
 
@@ -54,4 +261,4 @@ class WhereAND(WhereComposition):
 
 class WhereOR(WhereComposition):
     """Compose two Where objets with OR"""
-    _operator = "OR"
\ No newline at end of file
+    _operator = "OR"
@@ -1,3 +1,6 @@
+from typing import Iterable
+
+
 class TableNotFound(Exception):
     def __init__(self, tablename: str, basename: str):
         super().__init__(f'table {tablename} is not in {basename} database')
@@ -9,4 +12,9 @@ class TableAlreadyExists(Exception):
 
 class TableIsNotReal(Exception):
     def __init__(self, tablename: str):
-        super().__init__(f'table {tablename} is not real, but only Real tables are supported')
\ No newline at end of file
+        super().__init__(f'table {tablename} is not real, but only Real tables are supported')
+
+
+class FieldIsAmbiguous(KeyError):
+    def __init__(self, fieldname: str, tablename: str, candidates: Iterable[str]):
+        super().__init__(f'field {fieldname} is ambiguous in {tablename}, use one of: {", ".join(candidates)}')
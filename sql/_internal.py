@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Protocol, TypeVar, Iterable
+from typing import Protocol, TypeVar, Iterable, Iterator, Mapping, Sequence
 
 
 def proper_values(values: Iterable) -> list:
@@ -19,4 +19,49 @@ def proper_values(values: Iterable) -> list:
             proper_values.append('NULL')
         else:
             proper_values.append(f'{v}')
-    return proper_values
\ No newline at end of file
+    return proper_values
+
+
+def query_kind(query: str) -> str:
+    """
+    Get kind of SQL query by its command.
+
+    :param query: SQL query string.
+    :return: 'ddl' for CREATE, DROP and ALTER, lowercase command for other queries.
+    """
+    command = query.lstrip().split(None, 1)[0].upper() if query.strip() else ""
+    if command in ('CREATE', 'DROP', 'ALTER'):
+        return 'ddl'
+    return command.lower()
+
+
+def shaped_chunks(rows: Iterable[Mapping | Sequence], fields: Sequence[str],
+                  chunk_size: int, drop_nulls: bool = True) -> Iterator[tuple[tuple[str, ...], list[tuple]]]:
+    """
+    Split stream of rows into chunks of rows with the same set of non-NULL fields.
+
+    NULL values are dropped from rows, so database defaults are applied to them just as with DBase.insert.
+
+    :param rows: Iterable of <dict> rows or of <tuple> rows matching fields order.
+    :param fields: field names for <tuple> rows.
+    :param chunk_size: maximum amount of rows in one chunk.
+    :param drop_nulls: False means to keep NULL values, so they are written as NULL.
+    :return: Iterator of (field names, list of value tuples) pairs.
+    """
+    shape = None
+    chunk = []
+    for row in rows:
+        if isinstance(row, Mapping):
+            items = tuple((f, v) for f, v in row.items() if (v is not None) or not drop_nulls)
+        else:
+            items = tuple((f, v) for f, v in zip(fields, row) if (v is not None) or not drop_nulls)
+        row_shape = tuple(f for f, _ in items)
+
+        if chunk and ((row_shape != shape) or (len(chunk) >= chunk_size)):
+            yield shape, chunk
+            chunk = []
+        shape = row_shape
+        chunk.append(tuple(v for _, v in items))
+
+    if chunk:
+        yield shape, chunk
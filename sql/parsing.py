@@ -1,6 +1,10 @@
-from typing import Sequence, Mapping, Collection, Any
+import base64
+import itertools
+import json
+from typing import Sequence, Mapping, Collection, Any, Iterator, Iterable, TextIO, Callable
 from . import _Table
 from . import _Base
+from . import _Report
 
 def base_to_dict(base: '_Base.DBase') -> dict[str, list[dict[str, Any]]]:
     tables = dict()
@@ -12,12 +16,23 @@ def base_to_dict(base: '_Base.DBase') -> dict[str, list[dict[str, Any]]]:
 
 
 def table_to_list(table: '_Table.Table') -> list[dict[str, Any]]:
+    return list(table_to_iter(table))
+
+
+def table_to_iter(table: '_Table.Table', batch_size: int = 1000) -> Iterator[dict[str, Any]]:
+    """
+    Lazily iterate over Table rows as data mappings.
+
+    Rows are fetched from database in batches, so memory usage does not depend on Table size.
+
+    :param table: Table object instance
+    :param batch_size: amount of rows fetched from database at once
+    """
     query = table[:]
     fields = [f.name for f in query.fields]
-    body = query()
 
-    rows = [dict(zip(fields, row)) for row in body]
-    return rows
+    for row in query.stream(batch_size=batch_size):
+        yield dict(zip(fields, row))
 
 
 def table_to_schema(table: '_Table.Table') -> dict[str, str]:
@@ -35,17 +50,24 @@ def table_to_schema(table: '_Table.Table') -> dict[str, str]:
 
 
 def map_to_base(db_name: str, data_map: Mapping[str, Sequence[Mapping[str, Any]]],
-                primary_fields: Mapping[str, str] = None, foreign_fields: Mapping[str, str] = None) -> '_Base.DBase':
+                primary_fields: Mapping[str, str] = None, foreign_fields: Mapping[str, str] = None,
+                chunk_size: int = 1000,
+                progress: Callable[[str, '_Report.BulkReport'], None] = None) -> '_Base.DBase':
     """
     Create DBase from data mapping.
 
     data mapping entry must have following structure:
         Table_name: <Sequence of instance mappings <Field_name: Instance_value>>
 
+    Tables are created in order of foreign keys, so master tables go before their slave ones whatever order of data mapping is.
+    Every table is created right after its schema is inferred and its rows are inserted with bulk inserts.
+
     :param db_name: database filename
     :param data_map: data mapping
     :param primary_fields: mapping for spec primary key fields <Table_name: Primaryfield_name>
     :param foreign_fields: mapping for spec foreign key fields <Slave_table.Field_name: Master_table.Field_name>
+    :param chunk_size: amount of rows passed to database at once.
+    :param progress: function called with table name and its BulkReport after every table is loaded.
     """
     db = _Base.DBase(db_name)
     primary_fields = primary_fields if primary_fields is not None else dict()
@@ -58,16 +80,50 @@ def map_to_base(db_name: str, data_map: Mapping[str, Sequence[Mapping[str, Any]]
             foreigns[s_table] = dict()
         foreigns[s_table][s_field] = master
 
-    for table_name, table_data in data_map.items():
-        pk = primary_fields[table_name] if table_name in primary_fields else None
-        table_foreigns = foreigns[table_name] if table_name in foreigns else None
-        seq_to_table(db, table_name, table_data, primary_field=pk, foreign_fields=table_foreigns)
+    order = foreign_order(data_map.keys(), foreign_fields)
+    for table_name in order:
+        schema = seq_to_schema(data_map[table_name], primary_field=primary_fields.get(table_name),
+                               foreign_fields=foreigns.get(table_name))
+        table = db.new_table(table_name, schema)
+        report = table.INSERT_MANY(data_map[table_name], chunk_size=chunk_size)
+        if progress is not None:
+            progress(table_name, report)
 
     return db
 
 
-def seq_to_table(db: '_Base.DBase', name: str, rows: Sequence[Mapping[str, Any]], primary_field: str = None,
-                 foreign_fields: Mapping[str, str] = None, ignore_fields: Collection[str] = None) -> '_Table.Table':
+def foreign_order(tables: Iterable[str], foreign_fields: Mapping[str, str]) -> list[str]:
+    """
+    Sort tables so that master tables go before their slave ones.
+
+    Independent tables keep their order. References to tables not in given ones and to the same table are ignored.
+
+    :param tables: table names.
+    :param foreign_fields: mapping for spec foreign key fields <Slave_table.Field_name: Master_table.Field_name>
+    :return: list of sorted table names.
+    """
+    tables = list(tables)
+    masters = {t: set() for t in tables}
+    for slave, master in foreign_fields.items():
+        s_table, m_table = slave.split('.')[0], master.split('.')[0]
+        if (s_table in masters) and (m_table in masters) and (s_table != m_table):
+            masters[s_table].add(m_table)
+
+    order = []
+    done = set()
+    while len(order) < len(tables):
+        ready = [t for t in tables if (t not in done) and masters[t].issubset(done)]
+        if not ready:
+            raise ValueError(f'foreign keys of tables {[t for t in tables if t not in done]} are cyclic')
+        order.extend(ready)
+        done.update(ready)
+
+    return order
+
+
+def seq_to_table(db: '_Base.DBase', name: str, rows: Iterable[Mapping[str, Any]], primary_field: str = None,
+                 foreign_fields: Mapping[str, str] = None, ignore_fields: Collection[str] = None,
+                 sample: int = None, chunk_size: int = 1000) -> '_Table.Table':
     """
     Create new Table in existing DBase from data mapping sequence.
 
@@ -75,27 +131,39 @@ def seq_to_table(db: '_Base.DBase', name: str, rows: Sequence[Mapping[str, Any]]
     Row instance map entry must have following structure:
         Field_name: Instance_vale_for_field
 
+    With sample, schema is inferred from the first sample rows only, and then all rows are streamed into Table,
+    so rows may be any iterator, f.ex. of huge file, read in one pass with constant memory.
+    Fields must be present in sampled rows then.
+
     :param db: DBase object instance
     :param name: name for the new table
-    :param rows: sequence of data mappings containing row instances for table
+    :param rows: sequence or iterator of data mappings containing row instances for table
     :param primary_field: name of field which will be primary
     :param foreign_fields: map for foreign keys in table <Field_name: Master_table.Field_name>
     :param ignore_fields: sequence of field names to ignore
+    :param sample: amount of first rows to infer schema from. None means all rows.
+    :param chunk_size: amount of rows passed to database at once.
     """
-    foreign_fields = foreign_fields if foreign_fields is not None else dict()
-    ignore_fields = ignore_fields if ignore_fields is not None else tuple()
+    if (sample is None) and not isinstance(rows, Sequence):
+        rows = list(rows)
 
-    schema = seq_to_schema(rows, primary_field=primary_field, ignore_fields=ignore_fields, foreign_fields=foreign_fields)
-    table = db.new_table(name, schema)
+    if sample is None:
+        head = rows
+    else:
+        rows = iter(rows)
+        head = list(itertools.islice(rows, sample))
+        rows = itertools.chain(head, rows)
 
-    for row in rows:
-        table.INSERT(row)
+    schema = seq_to_schema(head, primary_field=primary_field, ignore_fields=ignore_fields, foreign_fields=foreign_fields)
+    table = db.new_table(name, schema)
+    table.INSERT_MANY(rows, chunk_size=chunk_size)
 
     return table
 
 
-def seq_to_schema(rows: Sequence[Mapping[str, Any]], primary_field: str = None,
-                  foreign_fields: Mapping[str, str] = None, ignore_fields: Collection[str] = None) -> dict:
+def seq_to_schema(rows: Iterable[Mapping[str, Any]], primary_field: str = None,
+                  foreign_fields: Mapping[str, str] = None, ignore_fields: Collection[str] = None,
+                  sample: int = None) -> dict:
     """
     Create Table SQL schema from data mapping sequence.
 
@@ -103,19 +171,19 @@ def seq_to_schema(rows: Sequence[Mapping[str, Any]], primary_field: str = None,
     Row instance map entry must have following structure:
         Field_name: Instance_vale_for_field
 
-    :param rows: sequence of data mappings containing row instances for table
+    Rows are read once. Field type is widened to fit values of all rows: NULL -> INTEGER -> REAL -> TEXT -> BLOB.
+
+    :param rows: sequence or iterator of data mappings containing row instances for table
     :param primary_field: name of field which will be primary
     :param foreign_fields: map for foreign keys in table <Field_name: Master_table.Field_name>
     :param ignore_fields: sequence of field names to ignore
+    :param sample: amount of first rows to infer schema from. None means all rows.
     """
-    schema = dict()
-    ignore_fields = ignore_fields if ignore_fields is not None else tuple()
-    foreign_fields = foreign_fields if foreign_fields is not None else dict()
+    inference = SchemaInference()
+    for row in itertools.islice(rows, sample):
+        inference.update(row)
 
-    for row in rows:
-        schema.update(map_to_schema(row, primary_field=primary_field, ignore_fields=ignore_fields, foreign_fields=foreign_fields))
-
-    return schema
+    return inference.schema(primary_field=primary_field, ignore_fields=ignore_fields, foreign_fields=foreign_fields)
 
 
 def map_to_schema(row: Mapping[str, Any], primary_field: str = None,
@@ -132,31 +200,70 @@ def map_to_schema(row: Mapping[str, Any], primary_field: str = None,
     :param foreign_fields: map for foreign keys in table <Field_name: Master_table.Field_name>
     :param ignore_fields: sequence of field names to ignore
     """
-    foreign_fields = foreign_fields if foreign_fields is not None else dict()
-    ignore_fields = ignore_fields if ignore_fields is not None else tuple()
-
-    schema = dict()
-    if primary_field is None:
-        schema.update({'id': 'INTEGER PRIMARY KEY AUTOINCREMENT'})
-    else:
-        schema.update({primary_field: f'{python_to_sql_type(row[primary_field])} PRIMARY KEY'})
-        ignore_fields += primary_field,
+    inference = SchemaInference()
+    inference.update(row)
+    return inference.schema(primary_field=primary_field, ignore_fields=ignore_fields, foreign_fields=foreign_fields)
 
-    fields = list(row.keys())
-    types = [python_to_sql_type(v) for v in row.values()]
 
-    for f, t in zip(fields, types):
-        if (f not in ignore_fields) and (f not in schema):
-            schema.update({f: t})
+class SchemaInference:
+    """
+    SchemaInference collects types of fields from data mappings one by one.
 
-    for slave, master in foreign_fields.items():
-        if slave in schema.keys():
-            m_table, m_field = master.split('.')
-            schema.update({f'foreign key({slave})': f'references {m_table}({m_field})'})
+    Type of field is widened to fit all its values: NULL -> INTEGER -> REAL -> TEXT -> BLOB,
+    so the order of rows does not matter, and only types of fields are kept, not rows themselves.
+    """
+    _widths = {"NULL": 0, "INTEGER": 1, "REAL": 2, "TEXT": 3, "BLOB": 4}
+    _types = {type(None): "NULL", bool: "INTEGER", int: "INTEGER", float: "REAL", str: "TEXT", bytes: "BLOB"}
+
+    def __init__(self):
+        self.fields: dict[str, str] = dict()
+        self.rows = 0
+
+    def update(self, row: Mapping[str, Any]) -> None:
+        """
+        Widen field types to fit values of given data mapping.
+
+        :param row: data mapping <Field_name: Instance_value>
+        """
+        fields = self.fields
+        widths = self._widths
+        for f, v in row.items():
+            t = self._types.get(type(v)) or python_to_sql_type(v)
+            current = fields.get(f)
+            if (current is None) or (widths[t] > widths[current]):
+                fields[f] = t
+        self.rows += 1
+
+    def schema(self, primary_field: str = None, foreign_fields: Mapping[str, str] = None,
+               ignore_fields: Collection[str] = None) -> dict:
+        """
+        Get Table SQL schema for collected field types.
+
+        :param primary_field: name of field which will be primary
+        :param foreign_fields: map for foreign keys in table <Field_name: Master_table.Field_name>
+        :param ignore_fields: sequence of field names to ignore
+        """
+        foreign_fields = foreign_fields if foreign_fields is not None else dict()
+        ignore_fields = ignore_fields if ignore_fields is not None else tuple()
+
+        schema = dict()
+        if primary_field is None:
+            schema.update({'id': 'INTEGER PRIMARY KEY AUTOINCREMENT'})
         else:
-            raise KeyError(f'foreign field field {slave} was not in table schema')
+            schema.update({primary_field: f'{self.fields[primary_field]} PRIMARY KEY'})
 
-    return schema
+        for f, t in self.fields.items():
+            if (f not in ignore_fields) and (f not in schema):
+                schema.update({f: t})
+
+        for slave, master in foreign_fields.items():
+            if slave in schema.keys():
+                m_table, m_field = master.split('.')
+                schema.update({f'foreign key({slave})': f'references {m_table}({m_field})'})
+            else:
+                raise KeyError(f'foreign field field {slave} was not in table schema')
+
+        return schema
 
 
 def python_to_sql_type(value) -> str:
@@ -176,3 +283,128 @@ def python_to_sql_type(value) -> str:
     elif value is None:
         return "NULL"
     raise TypeError(f"Not supported type {type(value)}")
+
+
+def read_ndjson(file: TextIO) -> Iterator[Any]:
+    """
+    Lazily read newline delimited JSON: one JSON value per line.
+
+    :param file: opened text file.
+    :return: iterator of parsed values.
+    """
+    for line in file:
+        if line.strip():
+            yield json.loads(line)
+
+
+def write_ndjson(file: TextIO, values: Iterable[Any]) -> int:
+    """
+    Write values as newline delimited JSON: one JSON value per line.
+
+    :param file: opened text file.
+    :param values: iterable of JSON serializable values.
+    :return: amount of written values.
+    """
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    count = 0
+    for value in values:
+        file.write(encode(value) + '\n')
+        count += 1
+    return count
+
+
+def row_to_json(row: dict[str, Any]) -> dict[str, Any]:
+    """
+    Make row JSON serializable: bytes values are replaced with {"base64": <encoded bytes>} objects.
+
+    SQLite values are never JSON objects, so such replacement is unambiguous, see row_from_json.
+    """
+    if not any(type(v) is bytes for v in row.values()):
+        return row
+    return {k: {'base64': base64.b64encode(v).decode('ascii')} if type(v) is bytes else v for k, v in row.items()}
+
+
+def row_from_json(row: dict[str, Any]) -> dict[str, Any]:
+    """Restore bytes values of row made with row_to_json."""
+    if not any(type(v) is dict for v in row.values()):
+        return row
+    return {k: base64.b64decode(v['base64']) if type(v) is dict else v for k, v in row.items()}
+
+
+def read_json_array(file: TextIO, buffer_size: int = 65536) -> Iterator[Any]:
+    """
+    Lazily read items of JSON array, f.ex. list of rows, without loading whole file.
+
+    File is read by buffer_size characters, so memory usage depends only on size of single item.
+
+    :param file: opened text file with JSON array.
+    :param buffer_size: amount of characters read from file at once.
+    :return: iterator of parsed array items.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    eof = False
+
+    def skip() -> bool:
+        """Skip whitespaces, reading file if needed. Return False at the end of file."""
+        nonlocal buffer, position, eof
+        while True:
+            while (position < len(buffer)) and buffer[position].isspace():
+                position += 1
+            if position < len(buffer):
+                return True
+            if eof:
+                return False
+            buffer, position = file.read(buffer_size), 0
+            eof = len(buffer) == 0
+
+    if not skip() or buffer[position] != '[':
+        raise ValueError('expected JSON array')
+    position += 1
+    if skip() and buffer[position] == ']':
+        return
+
+    while True:
+        if not skip():
+            raise ValueError('unexpected end of JSON array')
+
+        while True:
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+                if ((end < len(buffer)) and (buffer[end].isspace() or buffer[end] in ',]')) or eof:
+                    break
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            chunk = file.read(buffer_size)
+            eof = len(chunk) == 0
+            buffer, position = buffer[position:] + chunk, 0
+
+        yield item
+        position = end
+        if not skip():
+            raise ValueError('unexpected end of JSON array')
+        if buffer[position] == ']':
+            return
+        if buffer[position] != ',':
+            raise ValueError(f'expected "," or "]" in JSON array, got {buffer[position]!r}')
+        position += 1
+
+
+def write_json_array(file: TextIO, values: Iterable[Any]) -> int:
+    """
+    Write values as JSON array, one item per line, without collecting them in memory.
+
+    :param file: opened text file.
+    :param values: iterable of JSON serializable values.
+    :return: amount of written values.
+    """
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    count = 0
+    file.write('[')
+    for value in values:
+        file.write((',\n' if count else '\n') + encode(value))
+        count += 1
+    file.write('\n]\n' if count else ']\n')
+    return count
@@ -0,0 +1,43 @@
+from typing import Any, Mapping
+
+
+class Param:
+    """
+    Param is a named placeholder for value, that is given later, when query is called.
+
+    Query with Param is a template: it is compiled once and then called with different values:
+    tmpl = table['id', 'name'] == [Param('id'), ()]
+    tmpl(id=42)
+    """
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f':{self.name}'
+
+    def __str__(self) -> str:
+        return f':{self.name}'
+
+
+def has_params(params: tuple) -> bool:
+    """Check if there are Param placeholders among query parameters."""
+    return any(isinstance(p, Param) for p in params)
+
+
+def bind(params: tuple, values: Mapping[str, Any]) -> tuple:
+    """
+    Replace Param placeholders among query parameters with given values.
+
+    :param params: compiled query parameters.
+    :param values: dict of {Param name: value}.
+    :return: parameters to bind to query.
+    """
+    bound = []
+    for p in params:
+        if isinstance(p, Param):
+            try:
+                p = values[p.name]
+            except KeyError:
+                raise KeyError(f'value for parameter {p.name} is not given') from None
+        bound.append(p)
+    return tuple(bound)